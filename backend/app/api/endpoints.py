@@ -1,7 +1,9 @@
 """
 API endpoint handlers for the Insight Stream application.
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
@@ -10,8 +12,12 @@ from youtube_transcript_api._errors import (
     AgeRestricted,
     VideoUnplayable
 )
+import asyncio
+import json
 import logging
-from typing import List
+import secrets
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional
 
 from app.models.schemas import (
     VideoRequest, 
@@ -24,10 +30,18 @@ from app.models.schemas import (
     TranslateSegmentRequest,
     TranslateSegmentResponse,
     TranslateBatchRequest,
-    TranslateBatchResponse
+    TranslateBatchResponse,
+    TranslateJobResponse
 )
 from app.services.youtube_service import YouTubeService
 from app.services.ai_factory import get_ai_service
+from app.services.base_ai_service import (
+    BaseAIService,
+    DETAIL_ERROR_MESSAGE,
+    OVERVIEW_ERROR_MESSAGE,
+    limit_transcript
+)
+from app.services.translation_batcher import translate_with_cache, translation_batcher
 from app.core.config import settings
 from app.core.prompts import get_all_categories, get_modular_prompt
 from app.core.cache import transcript_cache
@@ -40,6 +54,72 @@ router = APIRouter()
 # Initialize services
 youtube_service = YouTubeService()
 
+# In-flight /summarize generations by response cache key
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+# Fixed parts of the /chat context prompt around the transcript
+CHAT_CONTEXT_PREFIX = "다음은 YouTube 영상의 전체 스크립트입니다:\n\n"
+CHAT_CONTEXT_SUFFIX = """
+
+[지시사항]
+- 위 스크립트의 내용만을 바탕으로 사용자의 질문에 정확하게 답변하세요
+- 스크립트에 명시적으로 언급된 내용만 답변하세요
+- 스크립트에 없는 내용은 추측하거나 외부 지식을 사용하지 마세요
+- 확실하지 않은 경우 "스크립트에서 해당 내용을 찾을 수 없습니다"라고 답변하세요
+- 답변은 간결하고 명확하게 작성하세요"""
+
+# How long a recorded context cache is reused: a minute less than the TTL it is
+# created with, so a chat turn never starts on a cache about to expire
+CONTEXT_CACHE_REUSE_SECONDS = max(settings.GEMINI_CONTEXT_CACHE_TTL_MINUTES - 1, 0) * 60
+
+
+def get_configured_ai_service(provider: str, model: Optional[str] = None) -> BaseAIService:
+    """
+    Resolve the AI service for a provider and make sure its API key is set.
+
+    Args:
+        provider: AI provider name ('gemini' or 'openai')
+        model: Model name (optional, uses the provider default)
+
+    Returns:
+        Shared AI service instance
+
+    Raises:
+        HTTPException: 400 if the provider's API key is not configured
+    """
+    ai_service = get_ai_service(provider=provider, model=model)
+
+    if not ai_service.is_configured:
+        provider_name = provider.upper()
+        logger.error("%s API key not configured", provider_name)
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "api_key_required",
+                "message": f"{provider_name} API 키가 설정되지 않았습니다",
+                "suggestion": f"backend/.env 파일에 {provider_name}_API_KEY를 입력해주세요"
+            }
+        )
+    return ai_service
+
+
+def _configured_ai_service(request_model: type, use_request_model: bool = True):
+    """
+    Build a dependency that resolves the configured AI service from a request body.
+
+    The dependency declares the same `request` body parameter as the endpoint,
+    so FastAPI parses the body once and shares it between both.
+
+    Args:
+        request_model: Request schema carrying ai_provider and model
+        use_request_model: Pass request.model through (False for translation endpoints)
+    """
+    async def dependency(request: request_model) -> BaseAIService:
+        model = request.model if use_request_model else None
+        return get_configured_ai_service(request.ai_provider, model)
+
+    return dependency
+
 
 @router.get("/")
 async def root():
@@ -51,26 +131,22 @@ async def root():
     }
 
 
-@router.post("/summarize", response_model=VideoResponse)
-async def summarize_video(request: VideoRequest):
+def _extract_video_id(url: str) -> str:
     """
-    Extract transcript and generate AI summary for a YouTube video.
+    Extract the video ID from a request URL or raise a 400 error.
 
     Args:
-        request: Contains YouTube URL
+        url: YouTube video URL
 
     Returns:
-        Complete video data with transcript and summaries
+        YouTube video ID
 
     Raises:
-        HTTPException: 400 for invalid URL, 404 for no transcript, 500 for server errors
+        HTTPException: 400 for invalid URL
     """
-    logger.info(f"📥 Received request for URL: {request.url}")
-
-    # Step 1: Extract video ID
-    video_id = youtube_service.extract_video_id(request.url)
+    video_id = youtube_service.extract_video_id(url)
     if not video_id:
-        logger.warning(f"Invalid URL: {request.url}")
+        logger.warning("Invalid URL: %s", url)
         raise HTTPException(
             status_code=400,
             detail={
@@ -80,30 +156,52 @@ async def summarize_video(request: VideoRequest):
             }
         )
 
-    logger.info(f"🆔 Extracted video ID: {video_id}")
+    logger.info("🆔 Extracted video ID: %s", video_id)
+    return video_id
 
-    # Step 2: Fetch video metadata (title, channel)
-    try:
-        metadata = youtube_service.get_video_metadata(video_id)
-        title = metadata['title']
-        logger.info(f"📺 Video title: {title}")
-        logger.info(f"📢 Channel: {metadata['channel']}")
-    except Exception as e:
-        logger.warning(f"Failed to fetch metadata, using defaults: {str(e)}")
+
+async def _fetch_video(video_id: str) -> tuple:
+    """
+    Fetch video metadata and transcript concurrently.
+
+    Metadata failures fall back to defaults; transcript failures are mapped
+    to user-facing HTTP errors.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Tuple of (metadata dict, transcript entry list, formatted transcript)
+
+    Raises:
+        HTTPException: 429/403/404/500 depending on the transcript error
+    """
+    metadata_result, transcript_result = await asyncio.gather(
+        run_in_threadpool(youtube_service.get_video_metadata, video_id),
+        run_in_threadpool(youtube_service.get_transcript, video_id),
+        return_exceptions=True
+    )
+
+    if isinstance(metadata_result, Exception):
+        logger.warning("Failed to fetch metadata, using defaults: %s", metadata_result)
         metadata = {
             'title': f"YouTube Video ({video_id})",
             'channel': 'Unknown Channel',
             'channel_url': ''
         }
-        title = metadata['title']
+    else:
+        metadata = metadata_result
+        logger.info("📺 Video title: %s", metadata['title'])
+        logger.info("📢 Channel: %s", metadata['channel'])
 
-    # Step 3: Fetch transcript
     try:
-        transcript_list = youtube_service.get_transcript(video_id)
-        full_transcript = youtube_service.format_transcript(transcript_list)
-        logger.info(f"✅ Transcript fetched ({len(transcript_list)} entries)")
+        if isinstance(transcript_result, Exception):
+            raise transcript_result
+        transcript_list = transcript_result
+        full_transcript = await run_in_threadpool(youtube_service.format_transcript, transcript_list)
+        logger.info("✅ Transcript fetched (%s entries)", len(transcript_list))
     except RequestBlocked:
-        logger.error(f"Request blocked by YouTube for video: {video_id}")
+        logger.error("Request blocked by YouTube for video: %s", video_id)
         raise HTTPException(
             status_code=429,
             detail={
@@ -113,7 +211,7 @@ async def summarize_video(request: VideoRequest):
             }
         )
     except AgeRestricted:
-        logger.error(f"Age-restricted video: {video_id}")
+        logger.error("Age-restricted video: %s", video_id)
         raise HTTPException(
             status_code=403,
             detail={
@@ -123,7 +221,7 @@ async def summarize_video(request: VideoRequest):
             }
         )
     except VideoUnplayable:
-        logger.error(f"Video unplayable: {video_id}")
+        logger.error("Video unplayable: %s", video_id)
         raise HTTPException(
             status_code=404,
             detail={
@@ -133,7 +231,7 @@ async def summarize_video(request: VideoRequest):
             }
         )
     except TranscriptsDisabled:
-        logger.error(f"Transcripts disabled for video: {video_id}")
+        logger.error("Transcripts disabled for video: %s", video_id)
         raise HTTPException(
             status_code=404,
             detail={
@@ -143,7 +241,7 @@ async def summarize_video(request: VideoRequest):
             }
         )
     except NoTranscriptFound:
-        logger.error(f"No transcript found for video: {video_id}")
+        logger.error("No transcript found for video: %s", video_id)
         raise HTTPException(
             status_code=404,
             detail={
@@ -153,7 +251,7 @@ async def summarize_video(request: VideoRequest):
             }
         )
     except VideoUnavailable:
-        logger.error(f"Video unavailable: {video_id}")
+        logger.error("Video unavailable: %s", video_id)
         raise HTTPException(
             status_code=404,
             detail={
@@ -163,7 +261,7 @@ async def summarize_video(request: VideoRequest):
             }
         )
     except Exception as e:
-        logger.error(f"Unexpected error fetching transcript: {str(e)}")
+        logger.error("Unexpected error fetching transcript: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -173,80 +271,137 @@ async def summarize_video(request: VideoRequest):
             }
         )
 
-    # Step 3: Generate AI summaries
-    try:
-        # Get AI service based on user's selection
-        ai_service = get_ai_service(provider=request.ai_provider, model=request.model)
+    return metadata, transcript_list, full_transcript
 
-        # Check if API key is configured
-        if not ai_service.is_configured:
-            provider_name = request.ai_provider.upper()
-            logger.error(f"{provider_name} API key not configured")
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "api_key_required",
-                    "message": f"{provider_name} API 키가 설정되지 않았습니다",
-                    "suggestion": f"backend/.env 파일에 {provider_name}_API_KEY를 입력해주세요"
-                }
-            )
 
-        logger.info(f"🤖 Generating AI summaries with {request.ai_provider.upper()}...")
+def _limit_transcripts(raw_text: str) -> tuple:
+    """
+    Truncate a transcript once for both the overview and the detail summary.
+
+    Args:
+        raw_text: Raw transcript text
 
-        # Get raw transcript text for AI processing
-        raw_text = youtube_service.get_raw_transcript_text(transcript_list)
+    Returns:
+        Tuple of (overview transcript, detail transcript)
+    """
+    detail_transcript = limit_transcript(raw_text, settings.TRANSCRIPT_LIMIT_DETAIL)
+    # The overview is normally a prefix of the detail slice, so cut it from there
+    # instead of the full transcript
+    overview_source = (
+        detail_transcript if settings.TRANSCRIPT_LIMIT_OVERVIEW <= settings.TRANSCRIPT_LIMIT_DETAIL else raw_text
+    )
+    return limit_transcript(overview_source, settings.TRANSCRIPT_LIMIT_OVERVIEW), detail_transcript
+
+
+def _build_modular_prompts(
+    ai_service: BaseAIService,
+    category: str,
+    format_type: str,
+    raw_text: str,
+    metadata: dict
+) -> tuple:
+    """
+    Build the overview and detail prompts with the transcript embedded.
+
+    Args:
+        ai_service: AI service the prompts are sent to (applies its own transcript limits)
+        category: Content category for prompt selection
+        format_type: Format type (dialogue or presentation)
+        raw_text: Raw transcript text
+        metadata: Video metadata (title, channel)
+
+    Returns:
+        Tuple of (overview prompt, detail prompt)
+    """
+    logger.info("📝 Using modular prompt - Topic: %s, Format: %s", category, format_type)
 
-        # Get category and format_type (with defaults)
-        category = request.category or "general"
-        format_type = request.format_type or "dialogue"  # Default to dialogue
+    # Use PromptGenerator for all requests (unified modular approach)
+    # The services only limit the transcript argument, which is empty for modular
+    # prompts, so provider limits (e.g. OpenAI token caps) are applied here
+    overview_transcript, detail_transcript = ai_service.fit_summary_transcripts(*_limit_transcripts(raw_text))
 
-        logger.info(f"📝 Using modular prompt - Topic: {category}, Format: {format_type}")
+    prompt_overview = get_modular_prompt(category, format_type, overview_transcript, "overview", metadata)
+    prompt_detail = get_modular_prompt(category, format_type, detail_transcript, "detail", metadata)
+    return prompt_overview, prompt_detail
 
-        # Use PromptGenerator for all requests (unified modular approach)
-        # Limit transcript for overview and detail
-        overview_transcript = raw_text[:settings.TRANSCRIPT_LIMIT_OVERVIEW]
-        detail_transcript = raw_text[:settings.TRANSCRIPT_LIMIT_DETAIL]
+
+def _remove_script_section(prompt: str) -> str:
+    """Remove the [TARGET SCRIPT] section and everything after it from prompt."""
+    head, sep, _ = prompt.partition("[TARGET SCRIPT]")
+    return head.strip() if sep else prompt
+
+
+async def _generate_summary(
+    request: VideoRequest,
+    ai_service: BaseAIService,
+    video_id: str,
+    category: str,
+    format_type: str,
+    response_key: tuple
+) -> tuple:
+    """
+    Fetch a video and generate its summaries, caching successful responses.
+
+    Args:
+        request: Original summarize request
+        ai_service: Configured AI service
+        video_id: YouTube video ID
+        category: Prompt category
+        format_type: Prompt format type
+        response_key: Response cache key for the video and settings
+
+    Returns:
+        Tuple of (VideoResponse, cached JSON body, ETag); body and ETag are None
+        when the response was not cached
+
+    Raises:
+        HTTPException: 404/403/429/500 depending on the transcript error
+    """
+    prompts_used = None
+
+    # Step 2: Fetch video metadata (title, channel) and transcript concurrently
+    metadata, transcript_list, full_transcript = await _fetch_video(video_id)
+    title = metadata['title']
+
+    # Get raw transcript text for AI processing
+    raw_text = youtube_service.get_raw_transcript_text(transcript_list)
+
+    # Step 3: Generate AI summaries
+    try:
+        logger.info("🤖 Generating AI summaries with %s...", request.ai_provider.upper())
 
         # Create complete prompts with transcript already embedded
-        prompt_overview = get_modular_prompt(category, format_type, overview_transcript, "overview", metadata)
-        prompt_detail = get_modular_prompt(category, format_type, detail_transcript, "detail", metadata)
+        prompt_overview, prompt_detail = _build_modular_prompts(ai_service, category, format_type, raw_text, metadata)
 
-        # Generate summaries with modular prompts
+        # Generate both summaries concurrently with modular prompts
         # Pass empty string as transcript since it's already in the prompt
-        summary_overview = ai_service.generate_summary_overview(
-            "",  # Empty: transcript already included in prompt_overview
-            custom_prompt=prompt_overview,
-            system_prompt=None
-        )
-        summary_detail = ai_service.generate_summary_detail(
-            "",  # Empty: transcript already included in prompt_detail
-            custom_prompt=prompt_detail,
-            system_prompt=None
+        summary_overview, summary_detail = await asyncio.gather(
+            ai_service.agenerate_summary_overview(
+                "",  # Empty: transcript already included in prompt_overview
+                custom_prompt=prompt_overview,
+                system_prompt=None
+            ),
+            ai_service.agenerate_summary_detail(
+                "",  # Empty: transcript already included in prompt_detail
+                custom_prompt=prompt_detail,
+                system_prompt=None
+            )
         )
 
         # Remove [TARGET SCRIPT] section from prompts for display
-        def remove_script_section(prompt: str) -> str:
-            """Remove the [TARGET SCRIPT] section and everything after it from prompt."""
-            if "[TARGET SCRIPT]" in prompt:
-                return prompt.split("[TARGET SCRIPT]")[0].strip()
-            return prompt
-        
         prompts_used = {
-            "overview": remove_script_section(prompt_overview),
-            "detail": remove_script_section(prompt_detail)
+            "overview": _remove_script_section(prompt_overview),
+            "detail": _remove_script_section(prompt_detail)
         }
 
         logger.info("✅ AI summaries generated successfully")
-    except HTTPException:
-        # Re-raise HTTP exceptions (like API key error)
-        raise
     except Exception as e:
-        logger.error(f"Error generating summaries: {str(e)}")
-        summary_overview = "AI 요약 생성 중 오류가 발생했습니다."
-        summary_detail = "## ⚠️ 오류\\n\\n요약을 생성하는 중 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
+        logger.error("Error generating summaries: %s", e)
+        summary_overview = OVERVIEW_ERROR_MESSAGE
+        summary_detail = DETAIL_ERROR_MESSAGE
 
-    # Step 4: Return response
-    response = VideoResponse(
+    # Step 4: Return response (fields are produced here, so skip model validation)
+    response = VideoResponse.model_construct(
         video_id=video_id,
         title=title,
         full_transcript=full_transcript,
@@ -256,16 +411,257 @@ async def summarize_video(request: VideoRequest):
         format_type=format_type,
         prompts_used=prompts_used,
         ai_provider=request.ai_provider,
-        model=request.model or "default"
+        model=ai_service.model_name
     )
 
     # Cache the raw transcript for future prompt edits
-    transcript_cache.set(video_id, raw_text, title=title, formatted_transcript=full_transcript)
-    
-    logger.info(f"✅ Successfully processed video {video_id}")
+    await run_in_threadpool(
+        transcript_cache.set, video_id, raw_text, title=title, formatted_transcript=full_transcript
+    )
+
+    logger.info("✅ Successfully processed video %s", video_id)
+
+    # Only successful summaries are reused for repeat requests
+    if prompts_used and summary_overview != OVERVIEW_ERROR_MESSAGE and summary_detail != DETAIL_ERROR_MESSAGE:
+        body = response.model_dump_json()
+        etag = await run_in_threadpool(transcript_cache.set_response, *response_key, body)
+        return response, body, etag
+    return response, None, None
+
+
+async def _coalesce(key: tuple, factory: Callable[[], Awaitable]):
+    """
+    Run one shared task per key, so concurrent identical requests wait on it.
+
+    The task is shielded, so a disconnecting client does not cancel the work
+    other requests are waiting on.
+
+    Args:
+        key: Request identity (e.g. the response cache key)
+        factory: Coroutine function doing the work
+
+    Returns:
+        The shared task's result
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = _inflight[key] = asyncio.ensure_future(factory())
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.info("🔗 Joining in-flight request for %s", key[0])
+    return await asyncio.shield(task)
+
+
+@router.post("/summarize", response_model=VideoResponse)
+async def summarize_video(
+    request: VideoRequest,
+    http_request: Request,
+    ai_service: BaseAIService = Depends(_configured_ai_service(VideoRequest))
+):
+    """
+    Extract transcript and generate AI summary for a YouTube video.
+
+    A previously generated response for the same video and settings is served
+    from cache with an ETag; a matching If-None-Match gets 304 Not Modified.
+    Concurrent requests for the same video and settings share one generation.
+
+    Args:
+        request: Contains YouTube URL
+        http_request: Incoming HTTP request (for If-None-Match)
+
+    Returns:
+        Complete video data with transcript and summaries
+
+    Raises:
+        HTTPException: 400 for invalid URL, 404 for no transcript, 500 for server errors
+    """
+    logger.info("📥 Received request for URL: %s", request.url)
+
+    # Step 1: Extract video ID
+    video_id = _extract_video_id(request.url)
+
+    # Get category and format_type (with defaults)
+    category = request.category or "general"
+    format_type = request.format_type or "dialogue"  # Default to dialogue
+
+    # Serve a finished response for the same video and settings from cache
+    # (only while its transcript is cached too, so chat keeps working after a hit)
+    response_key = (video_id, category, format_type, request.ai_provider, ai_service.model_name)
+    cached_response = await run_in_threadpool(transcript_cache.get_response, *response_key)
+    if cached_response:
+        body, etag = cached_response
+        if_none_match = http_request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            logger.info("✅ Not modified, cached summary for video %s", video_id)
+            return Response(status_code=304, headers={"ETag": etag})
+        logger.info("✅ Serving cached summary for video %s", video_id)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    # Concurrent requests for the same video and settings share one generation
+    response, body, etag = await _coalesce(
+        response_key,
+        partial(_generate_summary, request, ai_service, video_id, category, format_type, response_key)
+    )
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     return response
 
 
+def _sse_event(payload: dict) -> str:
+    """Encode a payload as a Server-Sent Events data frame."""
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+@router.post("/summarize/stream")
+async def summarize_video_stream(
+    request: VideoRequest,
+    ai_service: BaseAIService = Depends(_configured_ai_service(VideoRequest))
+):
+    """
+    Extract transcript and stream the AI summary as Server-Sent Events.
+
+    Events (JSON in each `data:` frame, discriminated by "type"):
+    - metadata: video_id, title, full_transcript and request settings (sent first)
+    - delta: next chunk of the detailed summary
+    - overview: the complete overview summary (sent as soon as it is ready)
+    - done: prompts used, sent after the detail stream finishes
+    - error: summary generation failed mid-stream
+
+    Args:
+        request: Contains YouTube URL
+
+    Returns:
+        StreamingResponse with text/event-stream content
+
+    Raises:
+        HTTPException: 400 for invalid URL, 404 for no transcript, 500 for server errors
+    """
+    logger.info("📥 Received streaming request for URL: %s", request.url)
+
+    video_id = _extract_video_id(request.url)
+
+    # Transcript errors are raised here, before the stream starts,
+    # so they still reach the client as regular HTTP errors
+    metadata, transcript_list, full_transcript = await _fetch_video(video_id)
+    title = metadata['title']
+    raw_text = youtube_service.get_raw_transcript_text(transcript_list)
+
+    category = request.category or "general"
+    format_type = request.format_type or "dialogue"
+    prompt_overview, prompt_detail = _build_modular_prompts(ai_service, category, format_type, raw_text, metadata)
+
+    async def event_stream():
+        yield _sse_event({
+            "type": "metadata",
+            "video_id": video_id,
+            "title": title,
+            "full_transcript": full_transcript,
+            "category": category,
+            "format_type": format_type,
+            "ai_provider": request.ai_provider,
+            "model": ai_service.model_name
+        })
+
+        overview_task = asyncio.create_task(
+            ai_service.agenerate_summary_overview("", custom_prompt=prompt_overview, system_prompt=None)
+        )
+        overview_sent = False
+        # Assembled for the response cache, so a later /summarize gets the same result
+        detail_parts = []
+        response = None
+
+        try:
+            async for delta in ai_service.stream_summary_detail("", custom_prompt=prompt_detail, system_prompt=None):
+                detail_parts.append(delta)
+                yield _sse_event({"type": "delta", "text": delta})
+                if not overview_sent and overview_task.done():
+                    yield _sse_event({"type": "overview", "text": overview_task.result()})
+                    overview_sent = True
+
+            summary_overview = await overview_task
+            if not overview_sent:
+                yield _sse_event({"type": "overview", "text": summary_overview})
+
+            prompts_used = {
+                "overview": _remove_script_section(prompt_overview),
+                "detail": _remove_script_section(prompt_detail)
+            }
+            yield _sse_event({"type": "done", "prompts_used": prompts_used})
+            logger.info("✅ Successfully streamed video %s", video_id)
+
+            if summary_overview != OVERVIEW_ERROR_MESSAGE:
+                response = VideoResponse.model_construct(
+                    video_id=video_id,
+                    title=title,
+                    full_transcript=full_transcript,
+                    summary_overview=summary_overview,
+                    summary_detail="".join(detail_parts),
+                    category=category,
+                    format_type=format_type,
+                    prompts_used=prompts_used,
+                    ai_provider=request.ai_provider,
+                    model=ai_service.model_name
+                )
+        except Exception as e:
+            logger.error("Error streaming summaries: %s", e)
+            yield _sse_event({
+                "type": "error",
+                "error": "summarize_error",
+                "message": "요약을 생성하는 중 문제가 발생했습니다",
+                "suggestion": "잠시 후 다시 시도해주세요"
+            })
+        finally:
+            overview_task.cancel()
+
+        # Cache the raw transcript for future prompt edits and chat
+        await run_in_threadpool(
+            transcript_cache.set, video_id, raw_text, title=title, formatted_transcript=full_transcript
+        )
+
+        # Only successful summaries are reused, under the same key /summarize uses
+        if response is not None:
+            response_key = (video_id, category, format_type, request.ai_provider, ai_service.model_name)
+            await run_in_threadpool(transcript_cache.set_response, *response_key, response.model_dump_json())
+
+    # Explicit identity encoding keeps GZipMiddleware from buffering the event stream
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Content-Encoding": "identity"}
+    )
+
+
+@router.delete("/api/cache/{video_id}")
+async def invalidate_video_cache(video_id: str, x_admin_token: str = Header("")):
+    """
+    Drop a video's cached metadata, transcript and summaries so the next request refetches them.
+
+    Args:
+        video_id: YouTube video ID
+        x_admin_token: Must match settings.ADMIN_TOKEN
+
+    Returns:
+        Confirmation with the invalidated video ID
+
+    Raises:
+        HTTPException: 403 if ADMIN_TOKEN is not set or the token does not match
+    """
+    if not settings.ADMIN_TOKEN or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        logger.warning("Rejected cache invalidation for video: %s", video_id)
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "forbidden",
+                "message": "캐시를 삭제할 권한이 없습니다",
+                "suggestion": "X-Admin-Token 헤더에 올바른 ADMIN_TOKEN을 입력해주세요"
+            }
+        )
+
+    youtube_service.invalidate(video_id)
+    await run_in_threadpool(transcript_cache.invalidate, video_id)
+    return {"video_id": video_id, "invalidated": True}
+
+
 @router.get("/api/prompts/categories", response_model=List[CategoryInfo])
 async def get_categories():
     """
@@ -280,7 +676,10 @@ async def get_categories():
 
 
 @router.post("/api/prompts/custom", response_model=VideoResponse)
-async def custom_summarize(request: CustomSummarizeRequest):
+async def custom_summarize(
+    request: CustomSummarizeRequest,
+    ai_service: BaseAIService = Depends(_configured_ai_service(CustomSummarizeRequest))
+):
     """
     Generate summary with custom prompts (for testing/immediate use).
 
@@ -290,7 +689,7 @@ async def custom_summarize(request: CustomSummarizeRequest):
     Returns:
         Video response with new summaries
     """
-    logger.info(f"🔄 Custom summarize request for video: {request.video_id}")
+    logger.info("🔄 Custom summarize request for video: %s", request.video_id)
 
     try:
         # Get transcript from cache or request
@@ -298,9 +697,9 @@ async def custom_summarize(request: CustomSummarizeRequest):
             transcript = request.transcript
             logger.info("📄 Using transcript from request")
         else:
-            transcript = transcript_cache.get(request.video_id)
+            transcript = await run_in_threadpool(transcript_cache.get, request.video_id)
             if not transcript:
-                logger.error(f"Transcript not found in cache for video: {request.video_id}")
+                logger.error("Transcript not found in cache for video: %s", request.video_id)
                 raise HTTPException(
                     status_code=404,
                     detail={
@@ -312,43 +711,37 @@ async def custom_summarize(request: CustomSummarizeRequest):
             logger.info("💾 Using cached transcript")
         
         # Get title and formatted transcript from cache
-        title = transcript_cache.get_title(request.video_id) or f"YouTube Video ({request.video_id})"
-        formatted_transcript = transcript_cache.get_formatted_transcript(request.video_id) or transcript
-        
-        # Get AI service
-        ai_service = get_ai_service(provider=request.ai_provider, model=request.model)
-
-        # Check if API key is configured
-        if not ai_service.is_configured:
-            provider_name = request.ai_provider.upper()
-            logger.error(f"{provider_name} API key not configured")
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "api_key_required",
-                    "message": f"{provider_name} API 키가 설정되지 않았습니다",
-                    "suggestion": f"backend/.env 파일에 {provider_name}_API_KEY를 입력해주세요"
-                }
-            )
-
-        logger.info(f"🤖 Generating summaries with custom prompts...")
-
-        # Generate summaries with custom prompts
-        summary_overview = ai_service.generate_summary_overview(
-            transcript,
-            custom_prompt=request.custom_overview_prompt,
-            system_prompt=request.custom_system_prompt
+        title = (
+            await run_in_threadpool(transcript_cache.get_title, request.video_id)
+            or f"YouTube Video ({request.video_id})"
+        )
+        formatted_transcript = (
+            await run_in_threadpool(transcript_cache.get_formatted_transcript, request.video_id)
+            or transcript
         )
 
-        summary_detail = ai_service.generate_summary_detail(
-            transcript,
-            custom_prompt=request.custom_detail_prompt,
-            system_prompt=request.custom_system_prompt
+        logger.info("🤖 Generating summaries with custom prompts...")
+
+        # Truncate once here; the services return already-limited text unchanged
+        overview_transcript, detail_transcript = _limit_transcripts(transcript)
+
+        # Generate both summaries concurrently with custom prompts
+        summary_overview, summary_detail = await asyncio.gather(
+            ai_service.agenerate_summary_overview(
+                overview_transcript,
+                custom_prompt=request.custom_overview_prompt,
+                system_prompt=request.custom_system_prompt
+            ),
+            ai_service.agenerate_summary_detail(
+                detail_transcript,
+                custom_prompt=request.custom_detail_prompt,
+                system_prompt=request.custom_system_prompt
+            )
         )
 
         logger.info("✅ Custom summaries generated successfully")
 
-        return VideoResponse(
+        return VideoResponse.model_construct(
             video_id=request.video_id,
             title=title,
             full_transcript=formatted_transcript,
@@ -366,7 +759,7 @@ async def custom_summarize(request: CustomSummarizeRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in custom summarize: {str(e)}")
+        logger.error("Error in custom summarize: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -377,8 +770,42 @@ async def custom_summarize(request: CustomSummarizeRequest):
         )
 
 
+async def _prepare_chat_context(video_id: str, transcript: str, ai_service: BaseAIService) -> tuple:
+    """
+    Build the chat context prompt and reuse (or create once) a provider-side cache of it.
+
+    Args:
+        video_id: YouTube video ID
+        transcript: Cached raw transcript
+        ai_service: Configured AI service
+
+    Returns:
+        Tuple of (context prompt, context cache name, callback that forgets the
+        cache when the provider can no longer use it)
+    """
+    # Construct context prompt with strict instructions
+    context_prompt = "".join((CHAT_CONTEXT_PREFIX, transcript, CHAT_CONTEXT_SUFFIX))
+
+    # Expired records read as None, so an expired provider cache is created again
+    context_cache = await run_in_threadpool(transcript_cache.get_context_cache, video_id, ai_service.model_name)
+    if context_cache is None:
+        context_cache = await run_in_threadpool(ai_service.create_context_cache, context_prompt)
+        await run_in_threadpool(
+            transcript_cache.set_context_cache,
+            video_id,
+            ai_service.model_name,
+            context_cache,
+            CONTEXT_CACHE_REUSE_SECONDS
+        )
+    on_cache_error = partial(transcript_cache.clear_context_cache, video_id, ai_service.model_name)
+    return context_prompt, context_cache, on_cache_error
+
+
 @router.post("/api/chat", response_model=ChatResponse)
-async def chat_with_video(request: ChatRequest):
+async def chat_with_video(
+    request: ChatRequest,
+    ai_service: BaseAIService = Depends(_configured_ai_service(ChatRequest))
+):
     """
     Chat with video based on transcript context.
 
@@ -391,14 +818,14 @@ async def chat_with_video(request: ChatRequest):
     Raises:
         HTTPException: 404 for missing transcript, 400 for API key issues, 500 for server errors
     """
-    logger.info(f"💬 Chat request for video: {request.video_id}")
+    logger.info("💬 Chat request for video: %s", request.video_id)
 
     try:
         # 1. Get transcript from cache
-        transcript = transcript_cache.get(request.video_id)
+        transcript = await run_in_threadpool(transcript_cache.get, request.video_id)
         
         if not transcript:
-            logger.error(f"Transcript not found in cache for video: {request.video_id}")
+            logger.error("Transcript not found in cache for video: %s", request.video_id)
             raise HTTPException(
                 status_code=404,
                 detail={
@@ -408,44 +835,28 @@ async def chat_with_video(request: ChatRequest):
                 }
             )
 
-        # 2. Get AI service
-        ai_service = get_ai_service(provider=request.ai_provider, model=request.model)
-
-        # 3. Check if API key is configured
-        if not ai_service.is_configured:
-            provider_name = request.ai_provider.upper()
-            logger.error(f"{provider_name} API key not configured")
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "api_key_required",
-                    "message": f"{provider_name} API 키가 설정되지 않았습니다",
-                    "suggestion": f"backend/.env 파일에 {provider_name}_API_KEY를 입력해주세요"
-                }
-            )
-
-        # 4. Construct context prompt with strict instructions
-        context_prompt = f"""다음은 YouTube 영상의 전체 스크립트입니다:
-
-{transcript}
-
-[지시사항]
-- 위 스크립트의 내용만을 바탕으로 사용자의 질문에 정확하게 답변하세요
-- 스크립트에 명시적으로 언급된 내용만 답변하세요
-- 스크립트에 없는 내용은 추측하거나 외부 지식을 사용하지 마세요
-- 확실하지 않은 경우 "스크립트에서 해당 내용을 찾을 수 없습니다"라고 답변하세요
-- 답변은 간결하고 명확하게 작성하세요"""
+        # 2. Construct context prompt and reuse its provider-side cache
+        context_prompt, context_cache, on_cache_error = await _prepare_chat_context(
+            request.video_id, transcript, ai_service
+        )
 
-        # 5. Call chat method with history
-        reply = ai_service.chat(context_prompt, request.message, request.conversation_history)
+        # 3. Call chat method with history
+        reply = await run_in_threadpool(
+            ai_service.chat,
+            context_prompt,
+            request.message,
+            request.conversation_history,
+            context_cache,
+            on_cache_error
+        )
 
-        logger.info(f"✅ Chat response generated for video: {request.video_id}")
+        logger.info("✅ Chat response generated for video: %s", request.video_id)
         return ChatResponse(video_id=request.video_id, reply=reply)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in chat: {str(e)}")
+        logger.error("Error in chat: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -456,7 +867,83 @@ async def chat_with_video(request: ChatRequest):
         )
 
 
-@router.post("/api/translate/segment", response_model=TranslateSegmentResponse)
+@router.post("/api/chat/stream")
+async def chat_with_video_stream(
+    request: ChatRequest,
+    ai_service: BaseAIService = Depends(_configured_ai_service(ChatRequest))
+):
+    """
+    Chat with video and stream the reply as Server-Sent Events.
+
+    Events (JSON in each `data:` frame, discriminated by "type"):
+    - delta: next chunk of the reply
+    - done: the reply is complete
+    - error: reply generation failed mid-stream
+
+    Args:
+        request: Contains video_id, message, conversation history, and AI settings
+
+    Returns:
+        StreamingResponse with text/event-stream content
+
+    Raises:
+        HTTPException: 404 for missing transcript, 400 for API key issues
+    """
+    logger.info("💬 Streaming chat request for video: %s", request.video_id)
+
+    transcript = await run_in_threadpool(transcript_cache.get, request.video_id)
+    if not transcript:
+        logger.error("Transcript not found in cache for video: %s", request.video_id)
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "transcript_not_found",
+                "message": "스크립트를 찾을 수 없습니다",
+                "suggestion": "영상을 다시 요약해주세요"
+            }
+        )
+
+    context_prompt, context_cache, on_cache_error = await _prepare_chat_context(
+        request.video_id, transcript, ai_service
+    )
+
+    loop = asyncio.get_running_loop()
+
+    def forget_context_cache() -> None:
+        # stream_chat calls this on the event loop; clear the record in a worker thread
+        loop.run_in_executor(None, on_cache_error)
+
+    async def event_stream():
+        try:
+            async for delta in ai_service.stream_chat(
+                context_prompt, request.message, request.conversation_history, context_cache, forget_context_cache
+            ):
+                yield _sse_event({"type": "delta", "text": delta})
+            yield _sse_event({"type": "done"})
+            logger.info("✅ Chat response streamed for video: %s", request.video_id)
+        except Exception as e:
+            logger.error("Error streaming chat: %s", e)
+            yield _sse_event({
+                "type": "error",
+                "error": "chat_error",
+                "message": "채팅 중 오류가 발생했습니다",
+                "suggestion": "잠시 후 다시 시도해주세요"
+            })
+
+    # Explicit identity encoding keeps GZipMiddleware from buffering the event stream
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Content-Encoding": "identity"}
+    )
+
+
+@router.post(
+    "/api/translate/segment",
+    response_model=TranslateSegmentResponse,
+    # Translations use the provider's translation-optimized model, not request.model
+    dependencies=[Depends(_configured_ai_service(TranslateSegmentRequest, use_request_model=False))]
+)
 async def translate_segment(request: TranslateSegmentRequest):
     """
     Translate a single text segment to Korean.
@@ -470,35 +957,19 @@ async def translate_segment(request: TranslateSegmentRequest):
     Raises:
         HTTPException: 400 for API key issues, 500 for server errors
     """
-    logger.info(f"🌐 Segment translation request for video: {request.video_id}")
+    logger.info("🌐 Segment translation request for video: %s", request.video_id)
 
     try:
-        # Get AI service with translation-optimized model
-        ai_service = get_ai_service(provider=request.ai_provider, model=None)
-
-        # Check if API key is configured
-        if not ai_service.is_configured:
-            provider_name = request.ai_provider.upper()
-            logger.error(f"{provider_name} API key not configured")
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "api_key_required",
-                    "message": f"{provider_name} API 키가 설정되지 않았습니다",
-                    "suggestion": f"backend/.env 파일에 {provider_name}_API_KEY를 입력해주세요"
-                }
-            )
+        # Translate segment (coalesced with concurrent requests into one batch call)
+        translation = await translation_batcher.submit(request.ai_provider, request.text)
 
-        # Translate segment
-        translation = ai_service.translate_segment(request.text)
-
-        logger.info(f"✅ Segment translated for video: {request.video_id}")
+        logger.info("✅ Segment translated for video: %s", request.video_id)
         return TranslateSegmentResponse(translation=translation)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in segment translation: {str(e)}")
+        logger.error("Error in segment translation: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -509,8 +980,42 @@ async def translate_segment(request: TranslateSegmentRequest):
         )
 
 
+async def _translate_in_shards(ai_service: BaseAIService, segments: List[str]) -> List[str]:
+    """
+    Translate segments as concurrent shards of TRANSLATION_SHARD_SIZE.
+
+    Long transcripts become several smaller LLM calls that overlap, bounded
+    by TRANSLATION_SHARD_CONCURRENCY to stay within provider rate limits.
+
+    Args:
+        ai_service: Configured AI service
+        segments: Text segments to translate
+
+    Returns:
+        Translated segments in input order
+    """
+    shard_size = settings.TRANSLATION_SHARD_SIZE
+    if len(segments) <= shard_size:
+        return await ai_service.atranslate_batch(segments)
+
+    semaphore = asyncio.Semaphore(settings.TRANSLATION_SHARD_CONCURRENCY)
+
+    async def translate_shard(shard: List[str]) -> List[str]:
+        async with semaphore:
+            return await ai_service.atranslate_batch(shard)
+
+    shards = await asyncio.gather(*(
+        translate_shard(segments[start:start + shard_size])
+        for start in range(0, len(segments), shard_size)
+    ))
+    return [translation for shard in shards for translation in shard]
+
+
 @router.post("/api/translate/batch", response_model=TranslateBatchResponse)
-async def translate_batch(request: TranslateBatchRequest):
+async def translate_batch(
+    request: TranslateBatchRequest,
+    ai_service: BaseAIService = Depends(_configured_ai_service(TranslateBatchRequest, use_request_model=False))
+):
     """
     Translate multiple text segments to Korean in batch.
 
@@ -523,35 +1028,21 @@ async def translate_batch(request: TranslateBatchRequest):
     Raises:
         HTTPException: 400 for API key issues, 500 for server errors
     """
-    logger.info(f"🌐 Batch translation request for video: {request.video_id} ({len(request.segments)} segments)")
+    logger.info("🌐 Batch translation request for video: %s (%s segments)", request.video_id, len(request.segments))
 
     try:
-        # Get AI service with translation-optimized model
-        ai_service = get_ai_service(provider=request.ai_provider, model=None)
-
-        # Check if API key is configured
-        if not ai_service.is_configured:
-            provider_name = request.ai_provider.upper()
-            logger.error(f"{provider_name} API key not configured")
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "api_key_required",
-                    "message": f"{provider_name} API 키가 설정되지 않았습니다",
-                    "suggestion": f"backend/.env 파일에 {provider_name}_API_KEY를 입력해주세요"
-                }
-            )
-
         # Translate batch
-        translations = ai_service.translate_batch(request.segments)
+        translations = await translate_with_cache(
+            request.ai_provider, request.segments, partial(_translate_in_shards, ai_service)
+        )
 
-        logger.info(f"✅ Batch translated for video: {request.video_id}")
+        logger.info("✅ Batch translated for video: %s", request.video_id)
         return TranslateBatchResponse(translations=translations)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in batch translation: {str(e)}")
+        logger.error("Error in batch translation: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -560,3 +1051,79 @@ async def translate_batch(request: TranslateBatchRequest):
                 "suggestion": "잠시 후 다시 시도해주세요"
             }
         )
+
+
+@router.post("/api/translate/jobs", response_model=TranslateJobResponse)
+async def create_translation_job(request: TranslateBatchRequest):
+    """
+    Submit a non-interactive bulk translation job to the OpenAI Batch API.
+
+    Batch jobs cost half as much as /api/translate/batch but complete
+    asynchronously; poll GET /api/translate/jobs/{job_id} for the result.
+
+    Args:
+        request: Contains video_id, segments array and AI provider (must be openai)
+
+    Returns:
+        TranslateJobResponse with the job ID
+
+    Raises:
+        HTTPException: 400 for unsupported provider or API key issues, 500 for server errors
+    """
+    logger.info("📦 Translation job request for video: %s (%s segments)", request.video_id, len(request.segments))
+
+    if request.ai_provider != "openai":
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "batch_api_unsupported",
+                "message": "일괄 번역 작업은 OpenAI에서만 지원됩니다",
+                "suggestion": "ai_provider를 openai로 설정하거나 /api/translate/batch를 사용해주세요"
+            }
+        )
+    ai_service = get_configured_ai_service("openai")
+
+    try:
+        job_id = await run_in_threadpool(ai_service.create_translation_job, request.segments)
+        return TranslateJobResponse(job_id=job_id, status="submitted")
+    except Exception as e:
+        logger.error("Error submitting translation job: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "translation_job_error",
+                "message": "번역 작업을 등록하는 중 오류가 발생했습니다",
+                "suggestion": "잠시 후 다시 시도해주세요"
+            }
+        )
+
+
+@router.get("/api/translate/jobs/{job_id}", response_model=TranslateJobResponse)
+async def get_translation_job(job_id: str):
+    """
+    Check a bulk translation job and return its translations once completed.
+
+    Args:
+        job_id: Job ID returned by POST /api/translate/jobs
+
+    Returns:
+        TranslateJobResponse with the job status, and translations when completed
+
+    Raises:
+        HTTPException: 400 for API key issues, 500 for server errors
+    """
+    ai_service = get_configured_ai_service("openai")
+
+    try:
+        status, translations = await run_in_threadpool(ai_service.get_translation_job, job_id)
+        return TranslateJobResponse(job_id=job_id, status=status, translations=translations)
+    except Exception as e:
+        logger.error("Error fetching translation job %s: %s", job_id, e)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "translation_job_error",
+                "message": "번역 작업 상태를 확인하는 중 오류가 발생했습니다",
+                "suggestion": "작업 ID를 확인한 뒤 다시 시도해주세요"
+            }
+        )
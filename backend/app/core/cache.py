@@ -1,160 +1,458 @@
 """
 Transcript caching system for optimized prompt re-summarization.
-Stores video transcripts in memory to avoid re-sending large texts.
-Single-session mode: only stores the most recent video.
+Stores video transcripts to avoid re-sending large texts, finished
+summary responses so repeat /summarize calls skip the whole pipeline, and
+translated segments so repeated lines are not sent to the LLM again.
+
+Backends:
+- Redis (when REDIS_URL is set): shared across uvicorn workers, values gzip-compressed
+- In-process TTLCache: used when Redis is not configured or unreachable
 """
-from typing import Optional
-from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from cachetools import TTLCache
+import gzip
+import hashlib
+import threading
+import time
 import logging
 
+import redis
+
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# Seconds to skip Redis after a connection failure before retrying it
+REDIS_RETRY_INTERVAL = 30
+
+# Fields stored gzip-compressed in Redis
+COMPRESSED_FIELDS = ('transcript', 'formatted_transcript')
+
 
 class TranscriptCache:
-    """Simple in-memory cache for video transcripts with TTL (single session mode)."""
-    
-    def __init__(self, ttl_hours: int = 24):
+    """Thread-safe transcript cache backed by Redis with an in-process TTL+LRU fallback."""
+
+    def __init__(self, ttl_hours: int = 24, maxsize: int = 256, translation_maxsize: int = 16384, redis_url: str = ""):
         """
         Initialize the transcript cache.
-        
+
         Args:
             ttl_hours: Time-to-live in hours for cached entries (default: 24)
+            maxsize: Maximum number of videos kept in-process before LRU eviction (default: 256)
+            translation_maxsize: Maximum number of translated segments kept in-process (default: 16384)
+            redis_url: Redis connection URL (optional). Empty string disables Redis.
         """
-        self._current_video: Optional[dict] = None
-        self._ttl = timedelta(hours=ttl_hours)
-        logger.info(f"💾 TranscriptCache initialized with TTL: {ttl_hours} hours (single session mode)")
-    
+        self._ttl_seconds = ttl_hours * 3600
+        # TTLCache checks expiry against time.monotonic(), a single float compare per lookup
+        self._store = TTLCache(maxsize=maxsize, ttl=self._ttl_seconds, timer=time.monotonic)
+        # Finished /summarize responses, keyed per video and summary settings
+        self._responses = TTLCache(maxsize=maxsize, ttl=self._ttl_seconds, timer=time.monotonic)
+        # Translated segments, keyed per translation model and source text
+        self._translations = TTLCache(maxsize=translation_maxsize, ttl=self._ttl_seconds, timer=time.monotonic)
+        # Endpoints run blocking work in the threadpool, so guard concurrent access
+        self._lock = threading.RLock()
+
+        self._redis = (
+            redis.Redis.from_url(redis_url, socket_timeout=1, socket_connect_timeout=1)
+            if redis_url else None
+        )
+        self._redis_retry_at = 0.0
+
+        backend = "Redis + in-process fallback" if self._redis else "in-process"
+        logger.info("💾 TranscriptCache initialized with TTL: %s hours (%s, max %s local videos)", ttl_hours, backend, maxsize)
+
+    @staticmethod
+    def _key(video_id: str) -> str:
+        """Redis key for a video's cache hash."""
+        return f"transcript:{video_id}"
+
+    def _redis_available(self) -> bool:
+        """Check whether Redis is configured and not in a failure back-off window."""
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, e: Exception) -> None:
+        """Back off from Redis for a while after an error."""
+        logger.warning("⚠️ Redis unavailable, using in-process cache: %s", e)
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+
     def set(self, video_id: str, transcript: str, title: str = None, formatted_transcript: str = None) -> None:
         """
-        Store transcript with metadata (overwrites previous cache).
-        
+        Store transcript with metadata (overwrites any previous entry for the video).
+
         Args:
             video_id: YouTube video ID
             transcript: Raw transcript text
             title: Video title (optional)
             formatted_transcript: Formatted transcript with timestamps (optional)
         """
-        self._current_video = {
+        entry = {
             'video_id': video_id,
             'transcript': transcript,
             'title': title,
             'formatted_transcript': formatted_transcript,
-            'timestamp': datetime.now()
+            # Wall-clock time for reporting only; expiry uses the stores' monotonic TTLs
+            'cached_at': time.time()
         }
-        logger.info(f"💾 Cached transcript for video: {video_id} ({len(transcript)} chars)")
-    
+
+        if self._redis_available():
+            mapping = {'cached_at': entry['cached_at']}
+            if title is not None:
+                mapping['title'] = title
+            for field in COMPRESSED_FIELDS:
+                if entry[field] is not None:
+                    mapping[field] = gzip.compress(entry[field].encode('utf-8'))
+            try:
+                key = self._key(video_id)
+                pipe = self._redis.pipeline()
+                pipe.delete(key)
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self._ttl_seconds)
+                pipe.execute()
+                logger.info("💾 Cached transcript in Redis for video: %s (%s chars)", video_id, len(transcript))
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            self._store[video_id] = entry
+        logger.info("💾 Cached transcript for video: %s (%s chars)", video_id, len(transcript))
+
+    def _get_field(self, video_id: str, field: str):
+        """Return a single field of the cached entry for a video, or None."""
+        if self._redis_available():
+            try:
+                value = self._redis.hget(self._key(video_id), field)
+                if value is not None:
+                    if field in COMPRESSED_FIELDS:
+                        return gzip.decompress(value).decode('utf-8')
+                    value = value.decode('utf-8')
+                    return float(value) if field == 'cached_at' else value
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            entry = self._store.get(video_id)
+        return entry.get(field) if entry else None
+
     def get(self, video_id: str) -> Optional[str]:
         """
-        Get transcript if exists, matches video_id, and not expired.
-        
+        Get transcript if cached and not expired.
+
         Args:
             video_id: YouTube video ID
-            
+
         Returns:
             Transcript text if found and valid, None otherwise
         """
-        if not self._current_video:
-            logger.warning(f"⚠️ No transcript in cache")
+        transcript = self._get_field(video_id, 'transcript')
+        if transcript is None:
+            logger.warning("⚠️ No transcript in cache for video: %s", video_id)
             return None
-        
-        if self._current_video['video_id'] != video_id:
-            logger.warning(f"⚠️ Video ID mismatch: requested {video_id}, cached {self._current_video['video_id']}")
-            return None
-        
-        age = datetime.now() - self._current_video['timestamp']
-        
-        if age > self._ttl:
-            logger.info(f"⏰ Transcript expired for video: {video_id} (age: {age})")
-            self._current_video = None
-            return None
-        
-        logger.info(f"✅ Retrieved cached transcript for video: {video_id} (age: {age})")
-        return self._current_video['transcript']
-    
+
+        logger.info("✅ Retrieved cached transcript for video: %s", video_id)
+        return transcript
+
     def get_title(self, video_id: str) -> Optional[str]:
         """
         Get cached video title.
-        
+
         Args:
             video_id: YouTube video ID
-            
+
         Returns:
             Video title if found, None otherwise
         """
-        if not self._current_video or self._current_video['video_id'] != video_id:
-            return None
-        return self._current_video.get('title')
-    
+        return self._get_field(video_id, 'title')
+
     def get_formatted_transcript(self, video_id: str) -> Optional[str]:
         """
         Get cached formatted transcript.
-        
+
         Args:
             video_id: YouTube video ID
-            
+
         Returns:
             Formatted transcript if found, None otherwise
         """
-        if not self._current_video or self._current_video['video_id'] != video_id:
+        return self._get_field(video_id, 'formatted_transcript')
+
+    def get_context_cache(self, video_id: str, model: str) -> Optional[str]:
+        """
+        Get the provider-side context cache name created for a video's chat context.
+
+        Args:
+            video_id: YouTube video ID
+            model: Model name the context cache was created for
+
+        Returns:
+            Cache name, empty string if caching was attempted and is unsupported,
+            or None if no attempt has been recorded or the recorded one has expired
+        """
+        field = f"context_cache:{model}"
+        if self._redis_available():
+            try:
+                name, expires_at = self._redis.hmget(self._key(video_id), field, f"{field}:expires_at")
+                if name is not None:
+                    if expires_at is None or float(expires_at) <= time.time():
+                        return None
+                    return name.decode('utf-8')
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            entry = self._store.get(video_id)
+            cached = entry.get('context_caches', {}).get(model) if entry else None
+        if cached is None or cached[1] <= time.time():
             return None
-        return self._current_video.get('formatted_transcript')
-    
-    def get_current_video_id(self) -> Optional[str]:
+        return cached[0]
+
+    def set_context_cache(self, video_id: str, model: str, cache_name: str, ttl_seconds: float) -> None:
+        """
+        Remember the provider-side context cache for a video's chat context.
+
+        Only applies while the video's transcript is cached.
+
+        Args:
+            video_id: YouTube video ID
+            model: Model name the context cache was created for
+            cache_name: Provider cache name, or empty string to record "not cacheable"
+            ttl_seconds: Seconds until the provider cache expires (the record is
+                ignored afterwards, so the cache is created again)
+        """
+        # Wall-clock expiry: the Redis record is shared with other worker processes
+        expires_at = time.time() + ttl_seconds
+        if self._redis_available():
+            try:
+                key = self._key(video_id)
+                if self._redis.exists(key):
+                    field = f"context_cache:{model}"
+                    self._redis.hset(key, mapping={field: cache_name, f"{field}:expires_at": expires_at})
+                    return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            entry = self._store.get(video_id)
+            if entry is not None:
+                entry.setdefault('context_caches', {})[model] = (cache_name, expires_at)
+
+    def clear_context_cache(self, video_id: str, model: str) -> None:
+        """
+        Forget a video's context cache so the next chat turn creates a new one.
+
+        Args:
+            video_id: YouTube video ID
+            model: Model name the context cache was created for
         """
-        Get the current cached video ID.
-        
+        if self._redis_available():
+            try:
+                field = f"context_cache:{model}"
+                self._redis.hdel(self._key(video_id), field, f"{field}:expires_at")
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            entry = self._store.get(video_id)
+            if entry is not None:
+                entry.get('context_caches', {}).pop(model, None)
+
+    @staticmethod
+    def _response_key(video_id: str, category: str, format_type: str, ai_provider: str, model: str) -> str:
+        """Redis/local key for a finished summary response."""
+        return f"summary:{video_id}:{category}:{format_type}:{ai_provider}:{model}"
+
+    def get_response(
+        self, video_id: str, category: str, format_type: str, ai_provider: str, model: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Get a finished summary response generated with the same settings.
+
+        Responses are only served while the video's transcript is cached too:
+        the two are stored separately and can be evicted independently, and a
+        hit skips the pipeline that would store the transcript again, which
+        chat and custom prompts need.
+
+        Args:
+            video_id: YouTube video ID
+            category: Prompt category
+            format_type: Prompt format type
+            ai_provider: AI provider name
+            model: Resolved model name
+
         Returns:
-            Video ID if cache exists, None otherwise
+            Tuple of (response JSON, ETag) if cached along with the transcript,
+            None otherwise
         """
-        if self._current_video:
-            return self._current_video['video_id']
-        return None
-    
+        key = self._response_key(video_id, category, format_type, ai_provider, model)
+
+        if self._redis_available():
+            try:
+                pipe = self._redis.pipeline()
+                pipe.hmget(key, 'body', 'etag')
+                pipe.hexists(self._key(video_id), 'transcript')
+                (body, etag), has_transcript = pipe.execute()
+                if body is not None and etag is not None and has_transcript:
+                    return gzip.decompress(body).decode('utf-8'), etag.decode('utf-8')
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            if video_id not in self._store:
+                return None
+            return self._responses.get(key)
+
+    def set_response(
+        self, video_id: str, category: str, format_type: str, ai_provider: str, model: str, body: str
+    ) -> str:
+        """
+        Store a finished summary response.
+
+        Args:
+            video_id: YouTube video ID
+            category: Prompt category
+            format_type: Prompt format type
+            ai_provider: AI provider name
+            model: Resolved model name
+            body: Response JSON
+
+        Returns:
+            ETag for the stored response
+        """
+        key = self._response_key(video_id, category, format_type, ai_provider, model)
+        etag = f'"{hashlib.sha1(body.encode("utf-8")).hexdigest()}"'
+
+        if self._redis_available():
+            try:
+                pipe = self._redis.pipeline()
+                pipe.hset(key, mapping={'body': gzip.compress(body.encode('utf-8')), 'etag': etag})
+                pipe.expire(key, self._ttl_seconds)
+                pipe.execute()
+                return etag
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            self._responses[key] = (body, etag)
+        return etag
+
+    @staticmethod
+    def _translation_key(model: str, text: str) -> str:
+        """Redis/local key for a translated segment."""
+        return f"translation:{model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+    def get_translations(self, model: str, texts: List[str]) -> List[Optional[str]]:
+        """
+        Look up cached translations for text segments.
+
+        Args:
+            model: Translation model name
+            texts: Source text segments
+
+        Returns:
+            Translation for each segment, or None where it is not cached
+        """
+        keys = [self._translation_key(model, text) for text in texts]
+
+        if self._redis_available():
+            try:
+                return [
+                    value.decode('utf-8') if value is not None else None
+                    for value in self._redis.mget(keys)
+                ]
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            return [self._translations.get(key) for key in keys]
+
+    def set_translations(self, model: str, texts: List[str], translations: List[str]) -> None:
+        """
+        Store translations for text segments.
+
+        Args:
+            model: Translation model name
+            texts: Source text segments
+            translations: Translation for each segment, in the same order
+        """
+        entries = {
+            self._translation_key(model, text): translation
+            for text, translation in zip(texts, translations)
+        }
+        if not entries:
+            return
+
+        if self._redis_available():
+            try:
+                pipe = self._redis.pipeline()
+                for key, translation in entries.items():
+                    pipe.set(key, translation, ex=self._ttl_seconds)
+                pipe.execute()
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            self._translations.update(entries)
+
+    def invalidate(self, video_id: str) -> None:
+        """
+        Drop a video's cached transcript (with its context caches) and summary responses.
+
+        Args:
+            video_id: YouTube video ID
+        """
+        response_prefix = f"summary:{video_id}:"
+        if self._redis_available():
+            try:
+                keys = [self._key(video_id), *self._redis.scan_iter(match=f"{response_prefix}*")]
+                self._redis.delete(*keys)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        # Clear the local stores too: they hold entries written while Redis was unreachable
+        with self._lock:
+            self._store.pop(video_id, None)
+            for key in [key for key in self._responses if key.startswith(response_prefix)]:
+                self._responses.pop(key, None)
+        logger.info("🧹 Invalidated cached transcript and summaries for video: %s", video_id)
+
     def clear_expired(self) -> int:
         """
-        Remove expired entry from cache.
-        
+        Remove expired entries from the in-process cache (Redis expires keys itself).
+
         Returns:
-            Number of entries removed (0 or 1)
-        """
-        if not self._current_video:
-            return 0
-        
-        now = datetime.now()
-        age = now - self._current_video['timestamp']
-        
-        if age > self._ttl:
-            video_id = self._current_video['video_id']
-            self._current_video = None
-            logger.info(f"🧹 Cleared expired transcript for video: {video_id}")
-            return 1
-        
-        return 0
-    
+            Number of entries removed
+        """
+        with self._lock:
+            expired = self._store.expire()
+            self._responses.expire()
+            self._translations.expire()
+
+        for video_id, _ in expired:
+            logger.info("🧹 Cleared expired transcript for video: %s", video_id)
+        return len(expired)
+
     def stats(self) -> dict:
         """
-        Get cache statistics.
-        
+        Get cache statistics for the in-process store.
+
         Returns:
             Dictionary with cache stats
         """
-        if self._current_video:
-            size = len(self._current_video['transcript'])
-            return {
-                'has_cache': True,
-                'video_id': self._current_video['video_id'],
-                'size_bytes': size,
-                'size_mb': round(size / 1024 / 1024, 2),
-                'cached_at': self._current_video['timestamp'].isoformat()
-            }
+        with self._lock:
+            entries = list(self._store.values())
+
+        size = sum(len(entry['transcript']) for entry in entries)
         return {
-            'has_cache': False,
-            'video_id': None,
-            'size_bytes': 0,
-            'size_mb': 0,
-            'cached_at': None
+            'backend': 'redis' if self._redis else 'memory',
+            'has_cache': bool(entries),
+            'entries': len(entries),
+            'max_entries': int(self._store.maxsize),
+            'video_ids': [entry['video_id'] for entry in entries],
+            'size_bytes': size,
+            'size_mb': round(size / 1024 / 1024, 2)
         }
 
 
 # Global cache instance
-transcript_cache = TranscriptCache()
+transcript_cache = TranscriptCache(redis_url=settings.REDIS_URL)
@@ -2,6 +2,8 @@
 Configuration settings management using Pydantic BaseSettings.
 Centralizes all environment variables and application settings.
 """
+from functools import cached_property
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -15,13 +17,14 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = False
+    THREADPOOL_SIZE: int = 64  # Worker threads for blocking calls (YouTube, sync AI clients)
 
     # CORS
     FRONTEND_URL: str = "http://localhost:8080"
 
-    @property
+    @cached_property
     def ALLOWED_ORIGINS(self) -> List[str]:
-        """List of allowed origins for CORS."""
+        """List of allowed origins for CORS (built once per settings instance)."""
         return [
             self.FRONTEND_URL,
             "http://localhost:8080",
@@ -35,6 +38,12 @@ class Settings(BaseSettings):
     # AI Provider Selection
     AI_PROVIDER: str = "gemini"  # Options: "gemini" or "openai"
 
+    @field_validator("AI_PROVIDER")
+    @classmethod
+    def normalize_ai_provider(cls, v: str) -> str:
+        """Lowercase the provider once at load so lookups can use it as-is."""
+        return v.lower()
+
     # Gemini AI
     GEMINI_API_KEY: str = "your_gemini_api_key_here"
     GEMINI_MODEL: str = "gemini-2.0-flash-exp"
@@ -42,6 +51,7 @@ class Settings(BaseSettings):
     GEMINI_TOP_P: float = 0.9
     GEMINI_MAX_TOKENS_OVERVIEW: int = 500
     GEMINI_MAX_TOKENS_DETAIL: int = 6000
+    GEMINI_CONTEXT_CACHE_TTL_MINUTES: int = 60  # Chat context cache lifetime on Gemini's side
 
     # OpenAI
     OPENAI_API_KEY: str = "your_openai_api_key_here"
@@ -49,6 +59,8 @@ class Settings(BaseSettings):
     OPENAI_TEMPERATURE: float = 0.7
     OPENAI_MAX_TOKENS_OVERVIEW: int = 500
     OPENAI_MAX_TOKENS_DETAIL: int = 6000
+    OPENAI_TOKEN_LIMIT_OVERVIEW: int = 4000  # Transcript token cap for overview prompts
+    OPENAI_TOKEN_LIMIT_DETAIL: int = 25000  # Transcript token cap for detail prompts
 
     # Transcript Processing
     TRANSCRIPT_LIMIT_OVERVIEW: int = 8000
@@ -56,14 +68,27 @@ class Settings(BaseSettings):
 
     # YouTube API (optional for anti-blocking)
     YOUTUBE_COOKIES: str = ""  # Optional: YouTube cookies for better access
+    YOUTUBE_REQUESTS_PER_SECOND: float = 0  # Client-side pacing for YouTube requests; 0 disables
     
     # ScraperAPI (required for cloud server anti-blocking)
     SCRAPERAPI_KEY: str = ""  # Required to bypass YouTube's cloud IP blocking
 
+    # Transcript cache (optional Redis for sharing across workers)
+    REDIS_URL: str = ""  # e.g. "redis://localhost:6379/0"; empty uses in-process cache only
+    ADMIN_TOKEN: str = ""  # Token for DELETE /api/cache/{video_id}; empty disables the endpoint
+
     # Translation Models (cost-optimized)
     GEMINI_TRANSLATION_MODEL: str = "gemini-1.5-flash"
     OPENAI_TRANSLATION_MODEL: str = "gpt-4o-mini"
 
+    # Segment translation micro-batching
+    TRANSLATION_BATCH_MAX_SIZE: int = 16  # Flush once this many segments are queued
+    TRANSLATION_BATCH_WINDOW_MS: int = 50  # Max wait for more segments before flushing
+
+    # Full-transcript translation sharding
+    TRANSLATION_SHARD_SIZE: int = 100  # Segments per LLM call in /api/translate/batch
+    TRANSLATION_SHARD_CONCURRENCY: int = 4  # Shards translated at the same time per request
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
@@ -2,6 +2,7 @@
 주제별 프롬프트 템플릿 - 모듈형 구조
 """
 
+from functools import lru_cache
 from typing import Dict, List
 
 
@@ -313,6 +314,35 @@ class PromptGenerator:
 [TARGET SCRIPT]
 {transcript}"""
 
+    def create_template(self, topic: str, format_type: str, prompt_type: str = "detail") -> str:
+        """
+        스크립트/메타데이터를 제외한 프롬프트 골격 생성
+
+        Args:
+            topic: 주제 (general, tech, business, ai, economy, politics, daily)
+            format_type: 형식 (dialogue, presentation)
+            prompt_type: 프롬프트 유형 (overview 또는 detail)
+
+        Returns:
+            {title}, {channel}, {transcript} 자리표시자가 남아있는 프롬프트 템플릿
+        """
+        # 전문 분야 선택 (기본값: general)
+        specialty = self.specialty_roles.get(topic, self.specialty_roles["general"])
+
+        # 공통 ROLE + 전문 분야 결합
+        combined_role = f"{self.base_role}\n\n전문 분야: {specialty}"
+
+        if prompt_type == "overview":
+            # Overview는 항상 동일한 템플릿 사용
+            template = self.BASE_OVERVIEW
+        elif format_type == "presentation":
+            # Detail은 format_type에 따라 템플릿 선택
+            template = self.BASE_DETAIL_PRESENTATION
+        else:  # dialogue 또는 기본값
+            template = self.BASE_DETAIL_DIALOGUE
+
+        return template.replace("{role}", combined_role)
+
     def create_prompt(
         self,
         topic: str,
@@ -334,39 +364,29 @@ class PromptGenerator:
         Returns:
             완성된 프롬프트
         """
-        # 전문 분야 선택 (기본값: general)
-        specialty = self.specialty_roles.get(topic, self.specialty_roles["general"])
+        template = self.create_template(topic, format_type, prompt_type)
+        return _fill_template(template, transcript, metadata)
 
-        # 공통 ROLE + 전문 분야 결합
-        combined_role = f"{self.base_role}\n\n전문 분야: {specialty}"
 
-        # 메타데이터 기본값 설정
-        if metadata is None:
-            metadata = {}
-        title = metadata.get('title', 'YouTube Video')
-        channel = metadata.get('channel', 'Unknown Channel')
+def _fill_template(template: str, transcript: str, metadata: dict = None) -> str:
+    """템플릿에 메타데이터와 스크립트 삽입"""
+    # 메타데이터 기본값 설정
+    if metadata is None:
+        metadata = {}
+    return template.format(
+        title=metadata.get('title', 'YouTube Video'),
+        channel=metadata.get('channel', 'Unknown Channel'),
+        transcript=transcript
+    )
 
-        if prompt_type == "overview":
-            # Overview는 항상 동일한 템플릿 사용
-            return self.BASE_OVERVIEW.format(
-                role=combined_role,
-                title=title,
-                channel=channel,
-                transcript=transcript
-            )
-        else:
-            # Detail은 format_type에 따라 템플릿 선택
-            if format_type == "presentation":
-                template = self.BASE_DETAIL_PRESENTATION
-            else:  # dialogue 또는 기본값
-                template = self.BASE_DETAIL_DIALOGUE
 
-            return template.format(
-                role=combined_role,
-                title=title,
-                channel=channel,
-                transcript=transcript
-            )
+_generator = PromptGenerator()
+
+
+@lru_cache(maxsize=128)
+def _build_template(topic: str, format_type: str, prompt_type: str) -> str:
+    """주제/형식/유형별 프롬프트 골격 (정적이므로 한 번만 생성)"""
+    return _generator.create_template(topic, format_type, prompt_type)
 
 
 def get_modular_prompt(
@@ -389,8 +409,7 @@ def get_modular_prompt(
     Returns:
         생성된 프롬프트
     """
-    generator = PromptGenerator()
-    return generator.create_prompt(topic, format_type, transcript, prompt_type, metadata)
+    return _fill_template(_build_template(topic, format_type, prompt_type), transcript, metadata)
 
 
 def get_all_categories() -> List[Dict[str, str]]:
@@ -400,8 +419,6 @@ def get_all_categories() -> List[Dict[str, str]]:
     Returns:
         카테고리 정보 리스트
     """
-    generator = PromptGenerator()
-    
     # Display names for each specialty
     display_names = {
         "general": "기본",
@@ -431,6 +448,6 @@ def get_all_categories() -> List[Dict[str, str]]:
             "display_name": display_names.get(category, category),
             "description": descriptions.get(category, "")
         }
-        for category in generator.specialty_roles.keys()
+        for category in _generator.specialty_roles.keys()
         if category != "default"  # default는 general과 중복이므로 제외
     ]
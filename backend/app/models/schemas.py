@@ -1,35 +1,40 @@
 """
 Pydantic models for request and response validation.
 """
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, Dict, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, Dict, List, Literal
+from typing_extensions import TypedDict
+import re
+
+# Matches youtube.com and youtu.be hosts anywhere in the URL, case-insensitively
+YOUTUBE_URL_PATTERN = re.compile(r'youtube\.com|youtu\.be', re.IGNORECASE)
+
+# Enumerated request fields are validated by pydantic-core without Python callbacks
+AIProvider = Literal["gemini", "openai"]
+FormatType = Literal["dialogue", "presentation"]
+
+# Shared config for request bodies: immutable, strict about unknown fields, trimmed strings
+REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
 
 
 class VideoRequest(BaseModel):
     """Request model for video summarization."""
+    model_config = REQUEST_MODEL_CONFIG
+
     url: str = Field(..., description="YouTube video URL")
-    ai_provider: Optional[str] = Field(default="gemini", description="AI provider (gemini or openai)")
+    ai_provider: AIProvider = Field(default="gemini", description="AI provider (gemini or openai)")
     model: Optional[str] = Field(default=None, description="Model name (optional, uses default if not specified)")
     category: Optional[str] = Field(default="general", description="Content category for prompt selection")
-    format_type: Optional[str] = Field(default="dialogue", description="Format type (dialogue or presentation) for modular prompts")
+    format_type: Optional[FormatType] = Field(default="dialogue", description="Format type (dialogue or presentation) for modular prompts")
 
     @field_validator('url')
     @classmethod
     def validate_youtube_url(cls, v: str) -> str:
         """Validate that the URL is a YouTube URL."""
-        if not any(d in v.lower() for d in ['youtube.com', 'youtu.be']):
+        if not YOUTUBE_URL_PATTERN.search(v):
             raise ValueError('URL must be a valid YouTube URL')
         return v
 
-    @field_validator('ai_provider')
-    @classmethod
-    def validate_ai_provider(cls, v: str) -> str:
-        """Validate that the AI provider is supported."""
-        v = v.lower()
-        if v not in ['gemini', 'openai']:
-            raise ValueError('AI provider must be either "gemini" or "openai"')
-        return v
-
 
 class VideoResponse(BaseModel):
     """Response model containing video data and summaries."""
@@ -47,12 +52,14 @@ class VideoResponse(BaseModel):
 
 class CustomSummarizeRequest(BaseModel):
     """Request model for custom prompt summarization."""
+    model_config = REQUEST_MODEL_CONFIG
+
     video_id: str
     transcript: Optional[str] = None  # Optional - will use cache if not provided
     custom_overview_prompt: Optional[str] = None
     custom_detail_prompt: Optional[str] = None
     custom_system_prompt: Optional[str] = None
-    ai_provider: str = "gemini"
+    ai_provider: AIProvider = "gemini"
     model: Optional[str] = None
 
 
@@ -80,23 +87,22 @@ class ErrorResponse(BaseModel):
     suggestion: str
 
 
+class ChatMessage(TypedDict):
+    """A single prior turn of a chat conversation."""
+    role: Literal["user", "assistant"]
+    content: str
+
+
 class ChatRequest(BaseModel):
     """Request model for chat with video."""
+    model_config = REQUEST_MODEL_CONFIG
+
     video_id: str = Field(..., description="YouTube video ID")
     message: str = Field(..., description="User's question or message")
-    conversation_history: List[dict] = Field(default=[], description="Previous conversation messages")
-    ai_provider: str = Field(default="gemini", description="AI provider (gemini or openai)")
+    conversation_history: List[ChatMessage] = Field(default_factory=list, description="Previous conversation messages")
+    ai_provider: AIProvider = Field(default="gemini", description="AI provider (gemini or openai)")
     model: Optional[str] = Field(default=None, description="Model name (optional)")
 
-    @field_validator('ai_provider')
-    @classmethod
-    def validate_ai_provider(cls, v: str) -> str:
-        """Validate that the AI provider is supported."""
-        v = v.lower()
-        if v not in ['gemini', 'openai']:
-            raise ValueError('AI provider must be either "gemini" or "openai"')
-        return v
-
 
 class ChatResponse(BaseModel):
     """Response model for chat with video."""
@@ -106,20 +112,13 @@ class ChatResponse(BaseModel):
 
 class TranslateSegmentRequest(BaseModel):
     """Request model for single segment translation."""
+    model_config = REQUEST_MODEL_CONFIG
+
     video_id: str = Field(..., description="YouTube video ID")
     text: str = Field(..., description="Text segment to translate")
-    ai_provider: str = Field(default="gemini", description="AI provider (gemini or openai)")
+    ai_provider: AIProvider = Field(default="gemini", description="AI provider (gemini or openai)")
     model: Optional[str] = Field(default=None, description="Model name (optional, uses translation-optimized model)")
 
-    @field_validator('ai_provider')
-    @classmethod
-    def validate_ai_provider(cls, v: str) -> str:
-        """Validate that the AI provider is supported."""
-        v = v.lower()
-        if v not in ['gemini', 'openai']:
-            raise ValueError('AI provider must be either "gemini" or "openai"')
-        return v
-
 
 class TranslateSegmentResponse(BaseModel):
     """Response model for single segment translation."""
@@ -128,21 +127,21 @@ class TranslateSegmentResponse(BaseModel):
 
 class TranslateBatchRequest(BaseModel):
     """Request model for batch translation."""
+    model_config = REQUEST_MODEL_CONFIG
+
     video_id: str = Field(..., description="YouTube video ID")
     segments: List[str] = Field(..., description="Text segments to translate (without timestamps)")
-    ai_provider: str = Field(default="gemini", description="AI provider (gemini or openai)")
+    ai_provider: AIProvider = Field(default="gemini", description="AI provider (gemini or openai)")
     model: Optional[str] = Field(default=None, description="Model name (optional, uses translation-optimized model)")
 
-    @field_validator('ai_provider')
-    @classmethod
-    def validate_ai_provider(cls, v: str) -> str:
-        """Validate that the AI provider is supported."""
-        v = v.lower()
-        if v not in ['gemini', 'openai']:
-            raise ValueError('AI provider must be either "gemini" or "openai"')
-        return v
-
 
 class TranslateBatchResponse(BaseModel):
     """Response model for batch translation."""
     translations: List[str]
+
+
+class TranslateJobResponse(BaseModel):
+    """Response model for a non-interactive batch translation job."""
+    job_id: str
+    status: str
+    translations: Optional[List[str]] = None
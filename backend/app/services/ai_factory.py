@@ -2,14 +2,37 @@
 AI Service Factory for selecting the appropriate AI provider.
 """
 import logging
-from typing import Optional
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, Optional, Tuple
 from app.core.config import settings
 from app.services.base_ai_service import BaseAIService
-from app.services.ai_service import GeminiService
-from app.services.openai_service import OpenAIService
 
 logger = logging.getLogger(__name__)
 
+# Supported providers and their service classes as (module, class name).
+# Modules are imported on first use so a deployment only loads the SDK it uses.
+AI_SERVICES: Dict[str, Tuple[str, str]] = {
+    "gemini": ("app.services.ai_service", "GeminiService"),
+    "openai": ("app.services.openai_service", "OpenAIService"),
+}
+
+
+@lru_cache(maxsize=16)
+def _build_ai_service(provider: str, model: Optional[str]) -> BaseAIService:
+    """Build one service (and its SDK clients) per (provider, model) and reuse it."""
+    service_path = AI_SERVICES.get(provider)
+    if service_path is None:
+        error_msg = f"Unsupported AI provider: {provider}. Supported providers: 'gemini', 'openai'"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+    module_name, class_name = service_path
+    service_cls = getattr(import_module(module_name), class_name)
+    service = service_cls(model_name=model)
+    logger.info("Using %s AI provider with model: %s", provider, service.model_name)
+    return service
+
 
 class AIServiceFactory:
     """Factory for creating AI service instances based on configuration."""
@@ -17,7 +40,10 @@ class AIServiceFactory:
     @staticmethod
     def create_ai_service(provider: Optional[str] = None, model: Optional[str] = None) -> BaseAIService:
         """
-        Create and return an AI service instance based on the provider parameter.
+        Return the AI service instance for the provider parameter.
+
+        Instances are cached per (provider, model), so SDK clients and their
+        connection pools are shared across requests.
 
         Args:
             provider: AI provider name ('gemini' or 'openai'). If None, uses settings.AI_PROVIDER
@@ -29,24 +55,15 @@ class AIServiceFactory:
         Raises:
             ValueError: If the AI_PROVIDER is not supported
         """
-        # Use provided provider or fall back to settings
-        selected_provider = (provider or settings.AI_PROVIDER).lower()
-
-        if selected_provider == "gemini":
-            logger.info(f"Using Gemini AI provider with model: {model or settings.GEMINI_MODEL}")
-            return GeminiService(model_name=model)
-        elif selected_provider == "openai":
-            logger.info(f"Using OpenAI provider with model: {model or settings.OPENAI_MODEL}")
-            return OpenAIService(model_name=model)
-        else:
-            error_msg = f"Unsupported AI provider: {selected_provider}. Supported providers: 'gemini', 'openai'"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        # Use provided provider or fall back to settings; both are already lowercase
+        # (request models only accept the exact literals, settings normalize at load)
+        selected_provider = provider or settings.AI_PROVIDER
+        return _build_ai_service(selected_provider, model)
 
 
 def get_ai_service(provider: Optional[str] = None, model: Optional[str] = None) -> BaseAIService:
     """
-    Convenience function to get an AI service instance.
+    Convenience function to get a shared AI service instance.
 
     Args:
         provider: AI provider name ('gemini' or 'openai'). If None, uses settings.AI_PROVIDER
@@ -2,16 +2,91 @@
 AI service for generating video summaries using Google Gemini.
 """
 import google.generativeai as genai
+from google.generativeai import caching
+from datetime import timedelta
+from types import MappingProxyType
 import logging
+from typing import AsyncIterator, Callable, Dict, Tuple
 from app.core.config import settings
-from app.services.base_ai_service import BaseAIService
+from app.services.base_ai_service import (
+    DEFAULT_DETAIL_PROMPT,
+    DEFAULT_OVERVIEW_PROMPT,
+    DETAIL_ERROR_MESSAGE,
+    OVERVIEW_ERROR_MESSAGE,
+    TRANSLATE_SEGMENT_PROMPT,
+    TRANSLATION_ERROR_MESSAGE,
+    TRANSLATION_FAILED_PREFIX,
+    compile_prompt,
+    join_segments,
+    limit_transcript
+)
 
 logger = logging.getLogger(__name__)
 
+# Replies returned when GEMINI_API_KEY is not set
+_API_KEY_MISSING = "Gemini API 키가 설정되지 않았습니다. .env 파일에 GEMINI_API_KEY를 설정해주세요."
+_API_KEY_MISSING_DETAIL = "## ⚙️ 설정 필요\\n\\nGemini API 키를 설정하면 AI 요약 기능을 사용할 수 있습니다."
+_API_KEY_MISSING_SHORT = "Gemini API 키가 설정되지 않았습니다."
 
-class GeminiService(BaseAIService):
+# Batch translation prompt, split around the {segments} slot
+_TRANSLATE_BATCH_HEAD, _TRANSLATE_BATCH_TAIL = """다음 {count}개의 영어/외국어 텍스트를 한국어로 번역하세요.
+
+[중요 규칙]
+1. 각 세그먼트를 순서대로 번역
+2. 번역 결과만 출력 (원문 포함 금지)
+3. 각 번역을 정확히 "---SEGMENT---"로 구분
+4. 추가 설명이나 주석 없이 번역만 출력
+5. 반드시 {count}개의 번역을 출력할 것 (누락 금지!)
+6. 원문의 의미와 맥락을 정확히 전달
+7. 자연스러운 한국어 표현 사용
+8. 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
+9. 대화체는 한국어 대화체로 자연스럽게 변환
+
+[출력 형식]
+번역1---SEGMENT---번역2---SEGMENT---번역3---SEGMENT---...---SEGMENT---번역{count}
+
+[입력 세그먼트]
+{segments}
+
+번역 시작:""".split("{segments}")
+
+# Chat history roles mapped to Gemini content roles (anything else is sent as the model)
+_ROLE_MAP = MappingProxyType({"user": "user", "assistant": "model"})
+
+# GenerativeModel instances shared across requests, keyed by model name
+_MODEL_CACHE: Dict[str, genai.GenerativeModel] = {}
+
+# Generation configs (read-only; built from settings once at import)
+_GEN_CFG_OVERVIEW = MappingProxyType({
+    "temperature": settings.GEMINI_TEMPERATURE,
+    "top_p": settings.GEMINI_TOP_P,
+    "max_output_tokens": settings.GEMINI_MAX_TOKENS_OVERVIEW,
+})
+_GEN_CFG_DETAIL = MappingProxyType({
+    "temperature": settings.GEMINI_TEMPERATURE,
+    "top_p": settings.GEMINI_TOP_P,
+    "max_output_tokens": settings.GEMINI_MAX_TOKENS_DETAIL,
+})
+_GEN_CFG_CHAT = MappingProxyType({
+    "temperature": settings.GEMINI_TEMPERATURE,
+    "top_p": settings.GEMINI_TOP_P,
+    "max_output_tokens": 1000,
+})
+_GEN_CFG_TRANSLATE_SEGMENT = MappingProxyType({
+    "temperature": 0.3,
+    "max_output_tokens": 1000,
+})
+_GEN_CFG_TRANSLATE_BATCH = MappingProxyType({
+    "temperature": 0.3,
+    "max_output_tokens": 8000,
+})
+
+
+class GeminiService:
     """Service for generating AI summaries using Google Gemini."""
 
+    __slots__ = ("model_name", "_is_configured")
+
     def __init__(self, model_name: str = None):
         """Initialize Gemini API with configuration.
 
@@ -23,7 +98,7 @@ class GeminiService(BaseAIService):
         if settings.GEMINI_API_KEY and settings.GEMINI_API_KEY != "your_gemini_api_key_here":
             genai.configure(api_key=settings.GEMINI_API_KEY)
             self._is_configured = True
-            logger.info(f"Gemini API configured successfully with model: {self.model_name}")
+            logger.info("Gemini API configured successfully with model: %s", self.model_name)
         else:
             self._is_configured = False
             logger.warning("Gemini API key not set! Please configure GEMINI_API_KEY in .env file")
@@ -33,6 +108,27 @@ class GeminiService(BaseAIService):
         """Check if Gemini API is properly configured."""
         return self._is_configured
 
+    def _get_model(self, name: str = None) -> genai.GenerativeModel:
+        """Return the shared GenerativeModel for a model name (default: this service's model)."""
+        name = name or self.model_name
+        model = _MODEL_CACHE.get(name)
+        if model is None:
+            # setdefault keeps the first instance if two threads race here
+            model = _MODEL_CACHE.setdefault(name, genai.GenerativeModel(name))
+        return model
+
+    def _build_overview_prompt(self, transcript: str, custom_prompt: str = None) -> str:
+        """Build the overview prompt from the transcript and optional custom template."""
+        # Limit transcript length for API efficiency
+        limited_transcript = limit_transcript(transcript, settings.TRANSCRIPT_LIMIT_OVERVIEW)
+        return compile_prompt(custom_prompt, DEFAULT_OVERVIEW_PROMPT)(limited_transcript)
+
+    def _build_detail_prompt(self, transcript: str, custom_prompt: str = None) -> str:
+        """Build the detail prompt from the transcript and optional custom template."""
+        # Limit transcript length
+        limited_transcript = limit_transcript(transcript, settings.TRANSCRIPT_LIMIT_DETAIL)
+        return compile_prompt(custom_prompt, DEFAULT_DETAIL_PROMPT)(limited_transcript)
+
     def generate_summary_overview(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
         """
         Generate a concise 2-3 sentence summary using Gemini.
@@ -45,48 +141,49 @@ class GeminiService(BaseAIService):
         Returns:
             Concise overview summary (2-3 sentences)
         """
-        if not self.is_configured:
-            return "Gemini API 키가 설정되지 않았습니다. .env 파일에 GEMINI_API_KEY를 설정해주세요."
+        if not self._is_configured:
+            return _API_KEY_MISSING
 
-        # Limit transcript length for API efficiency
-        limited_transcript = transcript[:settings.TRANSCRIPT_LIMIT_OVERVIEW]
-
-        # Use custom prompt if provided, otherwise use default
-        if custom_prompt:
-            # Check if prompt contains {transcript} placeholder
-            if "{transcript}" in custom_prompt:
-                # Traditional prompt: replace placeholder with transcript
-                prompt = custom_prompt.replace("{transcript}", limited_transcript)
-            else:
-                # Modular prompt: append transcript to the end
-                prompt = f"{custom_prompt}\n{limited_transcript}"
-        else:
-            prompt = f"""다음은 유튜브 영상의 전체 스크립트입니다.
+        prompt = self._build_overview_prompt(transcript, custom_prompt)
 
-이 영상의 핵심 내용을 2-3문장으로 간결하게 한국어로 요약해주세요.
-- 핵심 메시지와 주요 주제만 포함
-- 구체적이고 명확한 표현 사용
-- 2-3문장으로 제한
+        try:
+            model = self._get_model()
+            response = model.generate_content(
+                prompt,
+                generation_config=_GEN_CFG_OVERVIEW
+            )
+            return response.text.strip()
+        except Exception:
+            logger.exception("Error generating overview")
+            return OVERVIEW_ERROR_MESSAGE
 
-스크립트:
-{limited_transcript}
+    async def agenerate_summary_overview(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
+        """
+        Async variant of generate_summary_overview using Gemini's async client.
 
-요약:"""
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder.
+            system_prompt: System prompt for model behavior (optional, not used in Gemini)
+
+        Returns:
+            Concise overview summary (2-3 sentences)
+        """
+        if not self._is_configured:
+            return _API_KEY_MISSING
+
+        prompt = self._build_overview_prompt(transcript, custom_prompt)
 
         try:
-            model = genai.GenerativeModel(self.model_name)
-            response = model.generate_content(
+            model = self._get_model()
+            response = await model.generate_content_async(
                 prompt,
-                generation_config={
-                    "temperature": settings.GEMINI_TEMPERATURE,
-                    "top_p": settings.GEMINI_TOP_P,
-                    "max_output_tokens": settings.GEMINI_MAX_TOKENS_OVERVIEW,
-                }
+                generation_config=_GEN_CFG_OVERVIEW
             )
             return response.text.strip()
-        except Exception as e:
-            logger.error(f"Error generating overview: {str(e)}")
-            return "AI 요약 생성 중 오류가 발생했습니다."
+        except Exception:
+            logger.exception("Error generating overview")
+            return OVERVIEW_ERROR_MESSAGE
 
     def generate_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
         """
@@ -106,63 +203,126 @@ class GeminiService(BaseAIService):
         Returns:
             Detailed markdown summary
         """
-        if not self.is_configured:
-            return "## ⚙️ 설정 필요\\n\\nGemini API 키를 설정하면 AI 요약 기능을 사용할 수 있습니다."
-
-        # Limit transcript length
-        limited_transcript = transcript[:settings.TRANSCRIPT_LIMIT_DETAIL]
-
-        # Use custom prompt if provided, otherwise use default
-        if custom_prompt:
-            # Check if prompt contains {transcript} placeholder
-            if "{transcript}" in custom_prompt:
-                # Traditional prompt: replace placeholder with transcript
-                prompt = custom_prompt.replace("{transcript}", limited_transcript)
-            else:
-                # Modular prompt: append transcript to the end
-                prompt = f"{custom_prompt}\n{limited_transcript}"
-        else:
-            prompt = f"""다음은 유튜브 영상의 전체 스크립트입니다.
+        if not self._is_configured:
+            return _API_KEY_MISSING_DETAIL
 
-이 영상의 내용을 상세하게 분석하여 구조화된 마크다운 형식으로 정리해주세요.
+        prompt = self._build_detail_prompt(transcript, custom_prompt)
 
-요구사항:
-1. 한국어로 작성
-2. 마크다운 형식 사용 (##, ###, -, 등)
-3. 주요 섹션을 논리적으로 구분
-4. 각 섹션별로 핵심 포인트를 불릿 포인트(-)로 정리
-5. 이모지 사용 가능 (## 💡, ### 📊 등)
-6. 3-5개의 주요 섹션으로 구성
+        try:
+            model = self._get_model()
+            response = model.generate_content(
+                prompt,
+                generation_config=_GEN_CFG_DETAIL
+            )
+            return response.text.strip()
+        except Exception:
+            logger.exception("Error generating detail")
+            return DETAIL_ERROR_MESSAGE
 
-구조 예시:
-## 💡 [주요 주제 1]
-- 핵심 포인트 1
-- 핵심 포인트 2
+    async def agenerate_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
+        """
+        Async variant of generate_summary_detail using Gemini's async client.
 
-### [세부 주제]
-- 상세 설명
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder.
+            system_prompt: System prompt for model behavior (optional, not used in Gemini)
 
-스크립트:
-{limited_transcript}
+        Returns:
+            Detailed markdown summary
+        """
+        if not self._is_configured:
+            return _API_KEY_MISSING_DETAIL
 
-상세 요약:"""
+        prompt = self._build_detail_prompt(transcript, custom_prompt)
 
         try:
-            model = genai.GenerativeModel(self.model_name)
-            response = model.generate_content(
+            model = self._get_model()
+            response = await model.generate_content_async(
                 prompt,
-                generation_config={
-                    "temperature": settings.GEMINI_TEMPERATURE,
-                    "top_p": settings.GEMINI_TOP_P,
-                    "max_output_tokens": settings.GEMINI_MAX_TOKENS_DETAIL,
-                }
+                generation_config=_GEN_CFG_DETAIL
             )
             return response.text.strip()
-        except Exception as e:
-            logger.error(f"Error generating detail: {str(e)}")
-            return "## ⚠️ 오류\\n\\nAI 상세 요약 생성 중 오류가 발생했습니다."
+        except Exception:
+            logger.exception("Error generating detail")
+            return DETAIL_ERROR_MESSAGE
+
+    async def stream_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> AsyncIterator[str]:
+        """
+        Stream a detailed markdown summary from Gemini as it is generated.
+
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder.
+            system_prompt: System prompt for model behavior (optional, not used in Gemini)
 
-    def chat(self, context: str, user_message: str, history: list) -> str:
+        Yields:
+            Text chunks of the detailed summary
+        """
+        if not self._is_configured:
+            yield _API_KEY_MISSING_DETAIL
+            return
+
+        prompt = self._build_detail_prompt(transcript, custom_prompt)
+
+        model = self._get_model()
+        response = await model.generate_content_async(
+            prompt,
+            generation_config=_GEN_CFG_DETAIL,
+            stream=True
+        )
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+    def fit_summary_transcripts(self, overview_transcript: str, detail_transcript: str) -> Tuple[str, str]:
+        """Gemini needs no limit beyond the character limits; return the transcripts as-is."""
+        return overview_transcript, detail_transcript
+
+    def create_context_cache(self, context: str) -> str:
+        """
+        Upload the chat context to Gemini's context cache so later turns reuse it.
+
+        Args:
+            context: Context prompt with transcript
+
+        Returns:
+            Cached content name, or empty string if caching is unavailable for
+            this model/context (e.g. unsupported model or context too short)
+        """
+        if not self._is_configured:
+            return ""
+
+        try:
+            cache = caching.CachedContent.create(
+                model=self.model_name,
+                contents=[{"role": "user", "parts": [{"text": context}]}],
+                ttl=timedelta(minutes=settings.GEMINI_CONTEXT_CACHE_TTL_MINUTES)
+            )
+            logger.info("💾 Created Gemini context cache: %s", cache.name)
+            return cache.name
+        except Exception as e:
+            logger.info("Gemini context caching unavailable, sending full context: %s", e)
+            return ""
+
+    def _build_chat_contents(self, user_message: str, history: list) -> list:
+        """Build Gemini chat contents: conversation history, then the current user message."""
+        return [
+            *(
+                {"role": _ROLE_MAP.get(msg["role"], "model"), "parts": [{"text": msg["content"]}]}
+                for msg in history
+            ),
+            {"role": "user", "parts": [{"text": user_message}]}
+        ]
+
+    def chat(
+        self,
+        context: str,
+        user_message: str,
+        history: list,
+        context_cache: str = None,
+        on_cache_error: Callable[[], None] = None
+    ) -> str:
         """
         Chat with video based on transcript context.
 
@@ -170,52 +330,104 @@ class GeminiService(BaseAIService):
             context: Context prompt with transcript
             user_message: User's current question
             history: List of previous messages [{"role": "user|assistant", "content": "..."}]
+            context_cache: Cached content name from create_context_cache (optional).
+                When given, the context is not re-sent with the request.
+            on_cache_error: Called when the context cache cannot be used, so the
+                caller can forget it (optional)
 
         Returns:
             AI reply text
         """
-        if not self.is_configured:
-            return "Gemini API 키가 설정되지 않았습니다. .env 파일에 GEMINI_API_KEY를 설정해주세요."
+        if not self._is_configured:
+            return _API_KEY_MISSING
+
+        contents = self._build_chat_contents(user_message, history)
+
+        if context_cache:
+            try:
+                model = genai.GenerativeModel.from_cached_content(context_cache)
+                response = model.generate_content(contents, generation_config=_GEN_CFG_CHAT)
+                return response.text.strip()
+            except Exception as e:
+                # Cache may have expired on Gemini's side; fall back to sending the context
+                logger.warning("Gemini context cache unusable, sending full context: %s", e)
+                if on_cache_error is not None:
+                    on_cache_error()
 
         try:
-            model = genai.GenerativeModel(self.model_name)
-            
-            # Build contents list for Gemini format
-            contents = []
-            
+            model = self._get_model()
+
             # Add context as first user message
-            contents.append({
-                "role": "user",
-                "parts": [{"text": context}]
-            })
-            
-            # Add conversation history
-            for msg in history:
-                role = "user" if msg["role"] == "user" else "model"
-                contents.append({
-                    "role": role,
-                    "parts": [{"text": msg["content"]}]
-                })
-            
-            # Add current user message
-            contents.append({
-                "role": "user",
-                "parts": [{"text": user_message}]
-            })
-            
-            response = model.generate_content(
-                contents,
-                generation_config={
-                    "temperature": settings.GEMINI_TEMPERATURE,
-                    "top_p": settings.GEMINI_TOP_P,
-                    "max_output_tokens": 1000,
-                }
-            )
+            contents = [{"role": "user", "parts": [{"text": context}]}, *contents]
+
+            response = model.generate_content(contents, generation_config=_GEN_CFG_CHAT)
             return response.text.strip()
-        except Exception as e:
-            logger.error(f"Error in chat: {str(e)}")
+        except Exception:
+            logger.exception("Error in chat")
             return "채팅 중 오류가 발생했습니다. 다시 시도해주세요."
 
+    async def stream_chat(
+        self,
+        context: str,
+        user_message: str,
+        history: list,
+        context_cache: str = None,
+        on_cache_error: Callable[[], None] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat reply from Gemini as it is generated.
+
+        Args:
+            context: Context prompt with transcript
+            user_message: User's current question
+            history: List of previous messages [{"role": "user|assistant", "content": "..."}]
+            context_cache: Cached content name from create_context_cache (optional).
+                When given, the context is not re-sent with the request.
+            on_cache_error: Called when the context cache cannot be used, so the
+                caller can forget it (optional)
+
+        Yields:
+            Text chunks of the reply
+        """
+        if not self._is_configured:
+            yield _API_KEY_MISSING
+            return
+
+        contents = self._build_chat_contents(user_message, history)
+
+        if context_cache:
+            started = False
+            try:
+                model = genai.GenerativeModel.from_cached_content(context_cache)
+                response = await model.generate_content_async(
+                    contents, generation_config=_GEN_CFG_CHAT, stream=True
+                )
+                # Expired caches can also fail while the stream is read
+                async for chunk in response:
+                    if chunk.text:
+                        started = True
+                        yield chunk.text
+                return
+            except Exception as e:
+                if on_cache_error is not None:
+                    on_cache_error()
+                # A reply already partly sent cannot be restarted
+                if started:
+                    raise
+                # Cache may have expired on Gemini's side; fall back to sending the context
+                logger.warning("Gemini context cache unusable, sending full context: %s", e)
+
+        model = self._get_model()
+        response = await model.generate_content_async(
+            [{"role": "user", "parts": [{"text": context}]}, *contents],
+            generation_config=_GEN_CFG_CHAT,
+            stream=True
+        )
+
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
     def translate_segment(self, text: str) -> str:
         """
         Translate a single text segment to Korean using cost-optimized model.
@@ -226,36 +438,50 @@ class GeminiService(BaseAIService):
         Returns:
             Translated text in Korean
         """
-        if not self.is_configured:
-            return "Gemini API 키가 설정되지 않았습니다."
-
-        prompt = f"""다음 텍스트를 한국어로 번역해주세요.
-
-[번역 원칙]
-- 원문의 의미와 맥락을 정확히 전달
-- 자연스러운 한국어 표현 사용
-- 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
-- 대화체는 한국어 대화체로 자연스럽게 변환
+        if not self._is_configured:
+            return _API_KEY_MISSING_SHORT
 
-[원문]
-{text}
-
-[번역]"""
+        prompt = TRANSLATE_SEGMENT_PROMPT.replace("{text}", text)
 
         try:
             # Use cost-optimized translation model (Flash)
-            model = genai.GenerativeModel(settings.GEMINI_TRANSLATION_MODEL)
+            model = self._get_model(settings.GEMINI_TRANSLATION_MODEL)
             response = model.generate_content(
                 prompt,
-                generation_config={
-                    "temperature": 0.3,
-                    "max_output_tokens": 1000,
-                }
+                generation_config=_GEN_CFG_TRANSLATE_SEGMENT
             )
             return response.text.strip()
-        except Exception as e:
-            logger.error(f"Error in segment translation: {str(e)}")
-            return "번역 중 오류가 발생했습니다."
+        except Exception:
+            logger.exception("Error in segment translation")
+            return TRANSLATION_ERROR_MESSAGE
+
+    def _build_translate_batch_prompt(self, segments: list) -> str:
+        """Build the batch translation prompt with a numbered separator for reliability."""
+        return join_segments(
+            _TRANSLATE_BATCH_HEAD.replace("{count}", str(len(segments))),
+            "\n---SEGMENT---\n",
+            segments,
+            _TRANSLATE_BATCH_TAIL
+        )
+
+    def _parse_translate_batch(self, translated_text: str, segments: list) -> list:
+        """Split a batch translation reply into one translation per input segment."""
+        # Split result by separator
+        translations = [t.strip() for t in translated_text.strip().split("---SEGMENT---")]
+
+        # Validate count
+        if len(translations) != len(segments):
+            logger.error(
+                "Translation count mismatch: expected %s, got %s", len(segments), len(translations)
+            )
+            if len(translations) < len(segments):
+                # Pad with original text as fallback with clear indicator
+                translations.extend(TRANSLATION_FAILED_PREFIX + segment for segment in segments[len(translations):])
+            else:
+                # Truncate if too many
+                del translations[len(segments):]
+
+        return translations
 
     def translate_batch(self, segments: list) -> list:
         """
@@ -267,63 +493,45 @@ class GeminiService(BaseAIService):
         Returns:
             List of translated texts in Korean
         """
-        if not self.is_configured:
-            return ["Gemini API 키가 설정되지 않았습니다."] * len(segments)
-
-        # Use numbered separator for reliability
-        SEPARATOR = "\n---SEGMENT---\n"
-        segments_text = SEPARATOR.join(segments)
-
-        prompt = f"""다음 {len(segments)}개의 영어/외국어 텍스트를 한국어로 번역하세요.
-
-[중요 규칙]
-1. 각 세그먼트를 순서대로 번역
-2. 번역 결과만 출력 (원문 포함 금지)
-3. 각 번역을 정확히 "---SEGMENT---"로 구분
-4. 추가 설명이나 주석 없이 번역만 출력
-5. 반드시 {len(segments)}개의 번역을 출력할 것 (누락 금지!)
-6. 원문의 의미와 맥락을 정확히 전달
-7. 자연스러운 한국어 표현 사용
-8. 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
-9. 대화체는 한국어 대화체로 자연스럽게 변환
-
-[출력 형식]
-번역1---SEGMENT---번역2---SEGMENT---번역3---SEGMENT---...---SEGMENT---번역{len(segments)}
+        if not self._is_configured:
+            return [_API_KEY_MISSING_SHORT] * len(segments)
 
-[입력 세그먼트]
-{segments_text}
-
-번역 시작:"""
+        prompt = self._build_translate_batch_prompt(segments)
 
         try:
             # Use cost-optimized translation model (Flash)
-            model = genai.GenerativeModel(settings.GEMINI_TRANSLATION_MODEL)
+            model = self._get_model(settings.GEMINI_TRANSLATION_MODEL)
             response = model.generate_content(
                 prompt,
-                generation_config={
-                    "temperature": 0.3,
-                    "max_output_tokens": 8000,
-                }
+                generation_config=_GEN_CFG_TRANSLATE_BATCH
             )
+            return self._parse_translate_batch(response.text, segments)
+        except Exception:
+            logger.exception("Error in batch translation")
+            return [TRANSLATION_ERROR_MESSAGE] * len(segments)
 
-            # Split result by separator
-            translated_text = response.text.strip()
-            translations = [t.strip() for t in translated_text.split("---SEGMENT---")]
+    async def atranslate_batch(self, segments: list) -> list:
+        """
+        Async variant of translate_batch.
 
-            # Validate count
-            if len(translations) != len(segments):
-                logger.error(
-                    f"Translation count mismatch: expected {len(segments)}, got {len(translations)}"
-                )
-                # Pad with fallback message if too few
-                while len(translations) < len(segments):
-                    idx = len(translations)
-                    # Use original text as fallback with clear indicator
-                    translations.append(f"[번역 실패] {segments[idx]}")
-                # Truncate if too many
-                translations = translations[:len(segments)]
+        Args:
+            segments: List of text segments to translate
 
-            return translations
-        except Exception as e:
-            logger.error(f"Error in batch translation: {str(e)}")
-            return ["번역 중 오류가 발생했습니다."] * len(segments)
+        Returns:
+            List of translated texts in Korean
+        """
+        if not self._is_configured:
+            return [_API_KEY_MISSING_SHORT] * len(segments)
+
+        prompt = self._build_translate_batch_prompt(segments)
+
+        try:
+            model = self._get_model(settings.GEMINI_TRANSLATION_MODEL)
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=_GEN_CFG_TRANSLATE_BATCH
+            )
+            return self._parse_translate_batch(response.text, segments)
+        except Exception:
+            logger.exception("Error in batch translation")
+            return [TRANSLATION_ERROR_MESSAGE] * len(segments)
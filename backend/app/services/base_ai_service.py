@@ -2,32 +2,181 @@
 Base AI service interface for video summarization.
 All AI providers must implement this interface.
 """
-from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import AsyncIterator, Callable, List, Optional, Protocol, Tuple, runtime_checkable
 
+# Longest custom prompt cached as a template; longer ones have the transcript
+# embedded and never repeat
+CACHEABLE_TEMPLATE_LENGTH = 4096
 
-class BaseAIService(ABC):
-    """Abstract base class for AI summarization services."""
+# Returned in place of a summary or translation when generation fails
+OVERVIEW_ERROR_MESSAGE = "AI 요약 생성 중 오류가 발생했습니다."
+DETAIL_ERROR_MESSAGE = "## ⚠️ 오류\\n\\nAI 상세 요약 생성 중 오류가 발생했습니다."
+TRANSLATION_ERROR_MESSAGE = "번역 중 오류가 발생했습니다."
+# Prefixed to the original text of segments a batch reply left untranslated
+TRANSLATION_FAILED_PREFIX = "[번역 실패] "
 
-    @abstractmethod
-    def __init__(self):
-        """Initialize the AI service with API credentials."""
-        pass
+# Default prompt templates (plain strings; the {transcript}/{text} slot is filled with str.replace)
+DEFAULT_OVERVIEW_PROMPT = """다음은 유튜브 영상의 전체 스크립트입니다.
 
-    @abstractmethod
-    def generate_summary_overview(self, transcript: str) -> str:
+이 영상의 핵심 내용을 2-3문장으로 간결하게 한국어로 요약해주세요.
+- 핵심 메시지와 주요 주제만 포함
+- 구체적이고 명확한 표현 사용
+- 2-3문장으로 제한
+
+스크립트:
+{transcript}
+
+요약:"""
+
+DEFAULT_DETAIL_PROMPT = """다음은 유튜브 영상의 전체 스크립트입니다.
+
+이 영상의 내용을 상세하게 분석하여 구조화된 마크다운 형식으로 정리해주세요.
+
+요구사항:
+1. 한국어로 작성
+2. 마크다운 형식 사용 (##, ###, -, 등)
+3. 주요 섹션을 논리적으로 구분
+4. 각 섹션별로 핵심 포인트를 불릿 포인트(-)로 정리
+5. 이모지 사용 가능 (## 💡, ### 📊 등)
+6. 3-5개의 주요 섹션으로 구성
+
+구조 예시:
+## 💡 [주요 주제 1]
+- 핵심 포인트 1
+- 핵심 포인트 2
+
+### [세부 주제]
+- 상세 설명
+
+스크립트:
+{transcript}
+
+상세 요약:"""
+
+TRANSLATE_SEGMENT_PROMPT = """다음 텍스트를 한국어로 번역해주세요.
+
+[번역 원칙]
+- 원문의 의미와 맥락을 정확히 전달
+- 자연스러운 한국어 표현 사용
+- 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
+- 대화체는 한국어 대화체로 자연스럽게 변환
+
+[원문]
+{text}
+
+[번역]"""
+
+
+def join_segments(head: str, separator: str, segments: List[str], tail: str) -> str:
+    """
+    Build head + separator.join(segments) + tail in a single join.
+
+    Avoids materializing the joined segments as an intermediate string
+    before it is copied again into the surrounding prompt.
+
+    Args:
+        head: Text before the first segment
+        separator: Text between segments
+        segments: Segments to interleave
+        tail: Text after the last segment
+
+    Returns:
+        Combined prompt text
+    """
+    parts = [head]
+    for i, segment in enumerate(segments):
+        if i:
+            parts.append(separator)
+        parts.append(segment)
+    parts.append(tail)
+    return "".join(parts)
+
+
+def limit_transcript(transcript: str, limit: int) -> str:
+    """
+    Truncate a transcript to at most `limit` characters.
+
+    Transcripts already within the limit are returned as-is, so passing a
+    pre-limited transcript to a service does not copy it again.
+
+    Args:
+        transcript: Transcript text
+        limit: Maximum number of characters to keep
+
+    Returns:
+        The transcript, or its first `limit` characters
+    """
+    if len(transcript) <= limit:
+        return transcript
+    return transcript[:limit]
+
+
+def _build_prompt_builder(template: str) -> Callable[[str], str]:
+    """Turn a prompt template into a function mapping a transcript to the full prompt."""
+    if "{transcript}" in template:
+        # Traditional prompt: the transcript fills every placeholder
+        parts = template.split("{transcript}")
+        return lambda transcript: transcript.join(parts)
+    # Modular prompt: append transcript to the end; when it is already embedded
+    # (empty transcript argument) the prompt is used as-is, without another copy
+    return lambda transcript: f"{template}\n{transcript}" if transcript else template
+
+
+# Builders for real templates only (defaults and short user templates)
+_cached_prompt_builder = lru_cache(maxsize=32)(_build_prompt_builder)
+
+
+def compile_prompt(custom_prompt: Optional[str], default_template: str) -> Callable[[str], str]:
+    """
+    Compile a prompt template into a builder that inserts the transcript.
+
+    Default templates and short custom templates with a {transcript} placeholder
+    are compiled once and reused. Modular prompts carry the transcript already,
+    so they are unique per request and built directly instead of being hashed
+    into the cache.
+
+    Args:
+        custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder;
+            without it the transcript is appended after a newline.
+        default_template: Template used when no custom prompt is given
+
+    Returns:
+        Function mapping a transcript to the full prompt
+    """
+    if not custom_prompt:
+        return _cached_prompt_builder(default_template)
+    if len(custom_prompt) <= CACHEABLE_TEMPLATE_LENGTH and "{transcript}" in custom_prompt:
+        return _cached_prompt_builder(custom_prompt)
+    return _build_prompt_builder(custom_prompt)
+
+
+@runtime_checkable
+class BaseAIService(Protocol):
+    """
+    Interface for AI summarization services.
+
+    Providers implement it structurally (no inheritance needed), so concrete
+    services are plain classes without ABC metaclass overhead.
+    """
+
+    model_name: str
+
+    def generate_summary_overview(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
         """
         Generate a concise 2-3 sentence summary.
 
         Args:
             transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional)
+            system_prompt: System prompt for model behavior (optional)
 
         Returns:
             Concise overview summary (2-3 sentences)
         """
-        pass
+        ...
 
-    @abstractmethod
-    def generate_summary_detail(self, transcript: str) -> str:
+    def generate_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
         """
         Generate a detailed markdown summary.
 
@@ -39,14 +188,173 @@ class BaseAIService(ABC):
 
         Args:
             transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional)
+            system_prompt: System prompt for model behavior (optional)
 
         Returns:
             Detailed markdown summary
         """
-        pass
+        ...
+
+    async def agenerate_summary_overview(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
+        """
+        Async variant of generate_summary_overview.
+
+        Lets callers run the overview and detail requests concurrently.
+
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional)
+            system_prompt: System prompt for model behavior (optional)
+
+        Returns:
+            Concise overview summary (2-3 sentences)
+        """
+        ...
+
+    async def agenerate_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
+        """
+        Async variant of generate_summary_detail.
+
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional)
+            system_prompt: System prompt for model behavior (optional)
+
+        Returns:
+            Detailed markdown summary
+        """
+        ...
+
+    def stream_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> AsyncIterator[str]:
+        """
+        Stream a detailed markdown summary as it is generated.
+
+        Implementations are async generators yielding text chunks.
+
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional)
+            system_prompt: System prompt for model behavior (optional)
+
+        Returns:
+            Async iterator of summary text chunks
+        """
+        ...
+
+    def fit_summary_transcripts(self, overview_transcript: str, detail_transcript: str) -> Tuple[str, str]:
+        """
+        Apply provider-specific limits to transcripts embedded in prompts up front.
+
+        Used when the transcript is inlined into a modular prompt, where the
+        summary methods no longer see it separately.
+
+        Args:
+            overview_transcript: Character-limited overview transcript
+            detail_transcript: Character-limited detail transcript
+
+        Returns:
+            Tuple of (overview transcript, detail transcript)
+        """
+        ...
+
+    def create_context_cache(self, context: str) -> str:
+        """
+        Cache the chat context on the provider side, if supported.
+
+        Args:
+            context: Context prompt with transcript
+
+        Returns:
+            Provider cache name, or empty string if not cached
+        """
+        ...
+
+    def chat(
+        self,
+        context: str,
+        user_message: str,
+        history: list,
+        context_cache: str = None,
+        on_cache_error: Callable[[], None] = None
+    ) -> str:
+        """
+        Chat with video based on transcript context.
+
+        Args:
+            context: Context prompt with transcript
+            user_message: User's current question
+            history: List of previous messages [{"role": "user|assistant", "content": "..."}]
+            context_cache: Cache name from create_context_cache (optional)
+            on_cache_error: Called when the context cache cannot be used (optional)
+
+        Returns:
+            AI reply text
+        """
+        ...
+
+    def stream_chat(
+        self,
+        context: str,
+        user_message: str,
+        history: list,
+        context_cache: str = None,
+        on_cache_error: Callable[[], None] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat reply as it is generated.
+
+        Implementations are async generators yielding text chunks.
+
+        Args:
+            context: Context prompt with transcript
+            user_message: User's current question
+            history: List of previous messages [{"role": "user|assistant", "content": "..."}]
+            context_cache: Cache name from create_context_cache (optional)
+            on_cache_error: Called when the context cache cannot be used (optional)
+
+        Returns:
+            Async iterator over text chunks of the reply
+        """
+        ...
+
+    def translate_segment(self, text: str) -> str:
+        """
+        Translate a single text segment to Korean.
+
+        Args:
+            text: Text segment to translate
+
+        Returns:
+            Translated text in Korean
+        """
+        ...
+
+    def translate_batch(self, segments: list) -> list:
+        """
+        Translate multiple segments to Korean in one request.
+
+        Args:
+            segments: List of text segments to translate
+
+        Returns:
+            List of translated texts in Korean
+        """
+        ...
+
+    async def atranslate_batch(self, segments: list) -> list:
+        """
+        Async variant of translate_batch.
+
+        Args:
+            segments: List of text segments to translate
+
+        Returns:
+            List of translated texts in Korean
+        """
+        ...
 
     @property
-    @abstractmethod
     def is_configured(self) -> bool:
         """
         Check if the service is properly configured with API credentials.
@@ -54,4 +362,4 @@ class BaseAIService(ABC):
         Returns:
             True if configured, False otherwise
         """
-        pass
+        ...
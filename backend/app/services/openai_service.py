@@ -1,17 +1,132 @@
 """
 AI service for generating video summaries using OpenAI GPT models.
 """
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+import atexit
+from functools import lru_cache
+import httpx
+import json
 import logging
+import tiktoken
+from typing import AsyncIterator, Callable, List, Optional, Tuple
 from app.core.config import settings
-from app.services.base_ai_service import BaseAIService
+from app.services.base_ai_service import (
+    DEFAULT_DETAIL_PROMPT,
+    DEFAULT_OVERVIEW_PROMPT,
+    DETAIL_ERROR_MESSAGE,
+    OVERVIEW_ERROR_MESSAGE,
+    TRANSLATE_SEGMENT_PROMPT,
+    TRANSLATION_ERROR_MESSAGE,
+    compile_prompt,
+    limit_transcript
+)
 
 logger = logging.getLogger(__name__)
 
+# Replies returned when OPENAI_API_KEY is not set
+_API_KEY_MISSING = "OpenAI API 키가 설정되지 않았습니다. .env 파일에 OPENAI_API_KEY를 설정해주세요."
+_API_KEY_MISSING_DETAIL = "## ⚙️ 설정 필요\\n\\nOpenAI API 키를 설정하면 AI 요약 기능을 사용할 수 있습니다."
+_API_KEY_MISSING_SHORT = "OpenAI API 키가 설정되지 않았습니다."
 
-class OpenAIService(BaseAIService):
+# Batch translation prompt; numbered segments ("0. text") are appended after it
+_TRANSLATE_BATCH_PROMPT = """아래 번호가 매겨진 영어 텍스트 세그먼트들을 한국어로 번역해주세요.
+
+[중요 규칙]
+1. 원문을 포함하지 말고, 번역문만 출력하세요
+2. 모든 세그먼트를 빠짐없이 번역하고 각 세그먼트의 번호를 그대로 유지
+3. 원문의 의미와 맥락을 정확히 전달
+4. 자연스러운 한국어 표현 사용
+5. 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
+6. 대화체는 한국어 대화체로 자연스럽게 변환
+
+[출력 형식]
+다음 JSON 형식으로만 응답하세요 (i: 세그먼트 번호, t: 번역문):
+{"translations": [{"i": 0, "t": "안녕하세요"}, {"i": 1, "t": "어떻게 지내세요?"}]}
+
+[입력 세그먼트]
+"""
+
+# Default system messages, shared by every request (never mutated)
+_OVERVIEW_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 YouTube 영상의 내용을 간결하고 명확하게 요약하는 AI 어시스턴트입니다."
+}
+_DETAIL_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 YouTube 영상의 내용을 구조화된 마크다운 형식으로 상세하게 요약하는 AI 어시스턴트입니다. 이모지를 활용하여 가독성 높은 요약을 작성해주세요."
+}
+_TRANSLATE_SEGMENT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 전문 번역가입니다. 영어를 자연스러운 한국어로 번역해주세요."
+}
+_TRANSLATE_BATCH_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 전문 번역가입니다. 영어를 자연스러운 한국어로 번역해주세요. 원문을 포함하지 말고 번역문만 출력하세요."
+}
+
+# Clients shared by every OpenAIService: one TLS context and one connection pool per process
+_SSL_CONTEXT = httpx.create_ssl_context()
+_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=120)
+
+if settings.OPENAI_API_KEY and settings.OPENAI_API_KEY != "your_openai_api_key_here":
+    _CLIENT = OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=DefaultHttpxClient(verify=_SSL_CONTEXT, limits=_HTTP_LIMITS)
+    )
+    _ACLIENT = AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=DefaultAsyncHttpxClient(verify=_SSL_CONTEXT, limits=_HTTP_LIMITS)
+    )
+    atexit.register(_CLIENT.close)
+else:
+    _CLIENT = None
+    _ACLIENT = None
+
+
+async def aclose_client() -> None:
+    """Close the shared async client's connection pool (called on app shutdown)."""
+    if _ACLIENT is not None:
+        await _ACLIENT.close()
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Return the tokenizer for a model (loaded on first use, then shared)."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown or newer model names: use the GPT-4o family encoding
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _limit_tokens(text: str, model: str, limit: int) -> str:
+    """
+    Truncate text to at most `limit` tokens of the model's tokenizer.
+
+    Character limits undercount tokens for Korean text, so OpenAI prompts are
+    additionally capped by their real token count.
+
+    Args:
+        text: Text to truncate
+        model: OpenAI model name the text is sent to
+        limit: Maximum number of tokens to keep
+
+    Returns:
+        The text, or its first `limit` tokens decoded back to a string
+    """
+    encoding = _get_encoding(model)
+    # Transcripts are plain text: encode special-token strings as ordinary text
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= limit:
+        return text
+    return encoding.decode(tokens[:limit])
+
+
+class OpenAIService:
     """Service for generating AI summaries using OpenAI."""
 
+    __slots__ = ("model_name", "client", "aclient", "_is_configured")
+
     def __init__(self, model_name: str = None):
         """Initialize OpenAI API with configuration.
 
@@ -20,12 +135,14 @@ class OpenAIService(BaseAIService):
         """
         self.model_name = model_name or settings.OPENAI_MODEL
 
-        if settings.OPENAI_API_KEY and settings.OPENAI_API_KEY != "your_openai_api_key_here":
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # Bind the shared clients (None when the API key is not set)
+        self.client = _CLIENT
+        self.aclient = _ACLIENT
+
+        if _CLIENT is not None:
             self._is_configured = True
-            logger.info(f"OpenAI API configured successfully with model: {self.model_name}")
+            logger.info("OpenAI API configured successfully with model: %s", self.model_name)
         else:
-            self.client = None
             self._is_configured = False
             logger.warning("OpenAI API key not set! Please configure OPENAI_API_KEY in .env file")
 
@@ -34,6 +151,26 @@ class OpenAIService(BaseAIService):
         """Check if OpenAI API is properly configured."""
         return self._is_configured
 
+    def _build_overview_prompt(self, transcript: str, custom_prompt: str = None) -> str:
+        """Build the overview prompt from the transcript and optional custom template."""
+        # Limit transcript length for API efficiency
+        limited_transcript = _limit_tokens(
+            limit_transcript(transcript, settings.TRANSCRIPT_LIMIT_OVERVIEW),
+            self.model_name,
+            settings.OPENAI_TOKEN_LIMIT_OVERVIEW
+        )
+        return compile_prompt(custom_prompt, DEFAULT_OVERVIEW_PROMPT)(limited_transcript)
+
+    def _build_detail_prompt(self, transcript: str, custom_prompt: str = None) -> str:
+        """Build the detail prompt from the transcript and optional custom template."""
+        # Limit transcript length
+        limited_transcript = _limit_tokens(
+            limit_transcript(transcript, settings.TRANSCRIPT_LIMIT_DETAIL),
+            self.model_name,
+            settings.OPENAI_TOKEN_LIMIT_DETAIL
+        )
+        return compile_prompt(custom_prompt, DEFAULT_DETAIL_PROMPT)(limited_transcript)
+
     def generate_summary_overview(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
         """
         Generate a concise 2-3 sentence summary using OpenAI.
@@ -46,57 +183,57 @@ class OpenAIService(BaseAIService):
         Returns:
             Concise overview summary (2-3 sentences)
         """
-        if not self.is_configured:
-            return "OpenAI API 키가 설정되지 않았습니다. .env 파일에 OPENAI_API_KEY를 설정해주세요."
+        if not self._is_configured:
+            return _API_KEY_MISSING
 
-        # Limit transcript length for API efficiency
-        limited_transcript = transcript[:settings.TRANSCRIPT_LIMIT_OVERVIEW]
-
-        # Use custom prompt if provided, otherwise use default
-        if custom_prompt:
-            # Check if prompt contains {transcript} placeholder
-            if "{transcript}" in custom_prompt:
-                # Traditional prompt: replace placeholder with transcript
-                prompt = custom_prompt.replace("{transcript}", limited_transcript)
-            else:
-                # Modular prompt: append transcript to the end
-                prompt = f"{custom_prompt}\n{limited_transcript}"
-        else:
-            prompt = f"""다음은 유튜브 영상의 전체 스크립트입니다.
+        prompt = self._build_overview_prompt(transcript, custom_prompt)
+
+        # Use custom system prompt if provided
+        system_message = {"role": "system", "content": system_prompt} if system_prompt else _OVERVIEW_SYSTEM_MESSAGE
 
-이 영상의 핵심 내용을 2-3문장으로 간결하게 한국어로 요약해주세요.
-- 핵심 메시지와 주요 주제만 포함
-- 구체적이고 명확한 표현 사용
-- 2-3문장으로 제한
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[system_message, {"role": "user", "content": prompt}],
+                temperature=settings.OPENAI_TEMPERATURE,
+                max_tokens=settings.OPENAI_MAX_TOKENS_OVERVIEW
+            )
+            return response.choices[0].message.content.strip()
+        except Exception:
+            logger.exception("Error generating overview with OpenAI")
+            return OVERVIEW_ERROR_MESSAGE
+
+    async def agenerate_summary_overview(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
+        """
+        Async variant of generate_summary_overview using the AsyncOpenAI client.
 
-스크립트:
-{limited_transcript}
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder.
+            system_prompt: System prompt for model behavior (optional)
 
-요약:"""
+        Returns:
+            Concise overview summary (2-3 sentences)
+        """
+        if not self._is_configured:
+            return _API_KEY_MISSING
+
+        prompt = self._build_overview_prompt(transcript, custom_prompt)
 
         # Use custom system prompt if provided
-        sys_prompt = system_prompt or "당신은 YouTube 영상의 내용을 간결하고 명확하게 요약하는 AI 어시스턴트입니다."
+        system_message = {"role": "system", "content": system_prompt} if system_prompt else _OVERVIEW_SYSTEM_MESSAGE
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.aclient.chat.completions.create(
                 model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": sys_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=[system_message, {"role": "user", "content": prompt}],
                 temperature=settings.OPENAI_TEMPERATURE,
                 max_tokens=settings.OPENAI_MAX_TOKENS_OVERVIEW
             )
             return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error generating overview with OpenAI: {str(e)}")
-            return "AI 요약 생성 중 오류가 발생했습니다."
+        except Exception:
+            logger.exception("Error generating overview with OpenAI")
+            return OVERVIEW_ERROR_MESSAGE
 
     def generate_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
         """
@@ -116,72 +253,137 @@ class OpenAIService(BaseAIService):
         Returns:
             Detailed markdown summary
         """
-        if not self.is_configured:
-            return "## ⚙️ 설정 필요\\n\\nOpenAI API 키를 설정하면 AI 요약 기능을 사용할 수 있습니다."
+        if not self._is_configured:
+            return _API_KEY_MISSING_DETAIL
 
-        # Limit transcript length
-        limited_transcript = transcript[:settings.TRANSCRIPT_LIMIT_DETAIL]
-
-        # Use custom prompt if provided, otherwise use default
-        if custom_prompt:
-            # Check if prompt contains {transcript} placeholder
-            if "{transcript}" in custom_prompt:
-                # Traditional prompt: replace placeholder with transcript
-                prompt = custom_prompt.replace("{transcript}", limited_transcript)
-            else:
-                # Modular prompt: append transcript to the end
-                prompt = f"{custom_prompt}\n{limited_transcript}"
-        else:
-            prompt = f"""다음은 유튜브 영상의 전체 스크립트입니다.
+        prompt = self._build_detail_prompt(transcript, custom_prompt)
 
-이 영상의 내용을 상세하게 분석하여 구조화된 마크다운 형식으로 정리해주세요.
+        # Use custom system prompt if provided
+        system_message = {"role": "system", "content": system_prompt} if system_prompt else _DETAIL_SYSTEM_MESSAGE
 
-요구사항:
-1. 한국어로 작성
-2. 마크다운 형식 사용 (##, ###, -, 등)
-3. 주요 섹션을 논리적으로 구분
-4. 각 섹션별로 핵심 포인트를 불릿 포인트(-)로 정리
-5. 이모지 사용 가능 (## 💡, ### 📊 등)
-6. 3-5개의 주요 섹션으로 구성
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[system_message, {"role": "user", "content": prompt}],
+                temperature=settings.OPENAI_TEMPERATURE,
+                max_tokens=settings.OPENAI_MAX_TOKENS_DETAIL
+            )
+            return response.choices[0].message.content.strip()
+        except Exception:
+            logger.exception("Error generating detail with OpenAI")
+            return DETAIL_ERROR_MESSAGE
 
-구조 예시:
-## 💡 [주요 주제 1]
-- 핵심 포인트 1
-- 핵심 포인트 2
+    async def agenerate_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> str:
+        """
+        Async variant of generate_summary_detail using the AsyncOpenAI client.
 
-### [세부 주제]
-- 상세 설명
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder.
+            system_prompt: System prompt for model behavior (optional)
 
-스크립트:
-{limited_transcript}
+        Returns:
+            Detailed markdown summary
+        """
+        if not self._is_configured:
+            return _API_KEY_MISSING_DETAIL
 
-상세 요약:"""
+        prompt = self._build_detail_prompt(transcript, custom_prompt)
 
         # Use custom system prompt if provided
-        sys_prompt = system_prompt or "당신은 YouTube 영상의 내용을 구조화된 마크다운 형식으로 상세하게 요약하는 AI 어시스턴트입니다. 이모지를 활용하여 가독성 높은 요약을 작성해주세요."
+        system_message = {"role": "system", "content": system_prompt} if system_prompt else _DETAIL_SYSTEM_MESSAGE
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.aclient.chat.completions.create(
                 model=self.model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": sys_prompt
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=[system_message, {"role": "user", "content": prompt}],
                 temperature=settings.OPENAI_TEMPERATURE,
                 max_tokens=settings.OPENAI_MAX_TOKENS_DETAIL
             )
             return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error generating detail with OpenAI: {str(e)}")
-            return "## ⚠️ 오류\\n\\nAI 상세 요약 생성 중 오류가 발생했습니다."
+        except Exception:
+            logger.exception("Error generating detail with OpenAI")
+            return DETAIL_ERROR_MESSAGE
+
+    async def stream_summary_detail(self, transcript: str, custom_prompt: str = None, system_prompt: str = None) -> AsyncIterator[str]:
+        """
+        Stream a detailed markdown summary from OpenAI as it is generated.
+
+        Args:
+            transcript: Raw transcript text
+            custom_prompt: Custom prompt template (optional). Use {transcript} as placeholder.
+            system_prompt: System prompt for model behavior (optional)
+
+        Yields:
+            Text chunks of the detailed summary
+        """
+        if not self._is_configured:
+            yield _API_KEY_MISSING_DETAIL
+            return
+
+        prompt = self._build_detail_prompt(transcript, custom_prompt)
 
-    def chat(self, context: str, user_message: str, history: list) -> str:
+        # Use custom system prompt if provided
+        system_message = {"role": "system", "content": system_prompt} if system_prompt else _DETAIL_SYSTEM_MESSAGE
+
+        stream = await self.aclient.chat.completions.create(
+            model=self.model_name,
+            messages=[system_message, {"role": "user", "content": prompt}],
+            temperature=settings.OPENAI_TEMPERATURE,
+            max_tokens=settings.OPENAI_MAX_TOKENS_DETAIL,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def fit_summary_transcripts(self, overview_transcript: str, detail_transcript: str) -> Tuple[str, str]:
+        """
+        Cap transcripts embedded in modular prompts by their token count.
+
+        Args:
+            overview_transcript: Character-limited overview transcript
+            detail_transcript: Character-limited detail transcript
+
+        Returns:
+            Tuple of (overview transcript, detail transcript) within the token limits
+        """
+        return (
+            _limit_tokens(overview_transcript, self.model_name, settings.OPENAI_TOKEN_LIMIT_OVERVIEW),
+            _limit_tokens(detail_transcript, self.model_name, settings.OPENAI_TOKEN_LIMIT_DETAIL)
+        )
+
+    def create_context_cache(self, context: str) -> str:
+        """
+        OpenAI caches prompt prefixes automatically; no explicit cache is created.
+
+        chat() keeps the context as the leading system message so every turn
+        shares an identical prefix and hits OpenAI's prompt cache.
+
+        Args:
+            context: Context prompt with transcript
+
+        Returns:
+            Empty string (no explicit cache)
+        """
+        return ""
+
+    def _build_chat_messages(self, context: str, user_message: str, history: list) -> list:
+        """Build chat messages: context first (so the prefix is cacheable), history, then the user message."""
+        return [
+            {"role": "system", "content": context},
+            *history,
+            {"role": "user", "content": user_message}
+        ]
+
+    def chat(
+        self,
+        context: str,
+        user_message: str,
+        history: list,
+        context_cache: str = None,
+        on_cache_error: Callable[[], None] = None
+    ) -> str:
         """
         Chat with video based on transcript context.
 
@@ -189,34 +391,75 @@ class OpenAIService(BaseAIService):
             context: Context prompt with transcript
             user_message: User's current question
             history: List of previous messages [{"role": "user|assistant", "content": "..."}]
+            context_cache: Unused; OpenAI prompt caching is automatic
+            on_cache_error: Unused; no explicit cache can fail
 
         Returns:
             AI reply text
         """
-        if not self.is_configured:
-            return "OpenAI API 키가 설정되지 않았습니다. .env 파일에 OPENAI_API_KEY를 설정해주세요."
+        if not self._is_configured:
+            return _API_KEY_MISSING
 
         try:
-            # Build messages list
-            messages = [{"role": "system", "content": context}]
-            
-            # Add conversation history
-            messages.extend(history)
-            
-            # Add current user message
-            messages.append({"role": "user", "content": user_message})
-            
             response = self.client.chat.completions.create(
                 model=self.model_name,
-                messages=messages,
+                messages=self._build_chat_messages(context, user_message, history),
                 temperature=settings.OPENAI_TEMPERATURE,
                 max_tokens=1000
             )
             return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error in chat with OpenAI: {str(e)}")
+        except Exception:
+            logger.exception("Error in chat with OpenAI")
             return "채팅 중 오류가 발생했습니다. 다시 시도해주세요."
 
+    async def stream_chat(
+        self,
+        context: str,
+        user_message: str,
+        history: list,
+        context_cache: str = None,
+        on_cache_error: Callable[[], None] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat reply from OpenAI as it is generated.
+
+        Args:
+            context: Context prompt with transcript
+            user_message: User's current question
+            history: List of previous messages [{"role": "user|assistant", "content": "..."}]
+            context_cache: Unused; OpenAI prompt caching is automatic
+            on_cache_error: Unused; no explicit cache can fail
+
+        Yields:
+            Text chunks of the reply
+        """
+        if not self._is_configured:
+            yield _API_KEY_MISSING
+            return
+
+        stream = await self.aclient.chat.completions.create(
+            model=self.model_name,
+            messages=self._build_chat_messages(context, user_message, history),
+            temperature=settings.OPENAI_TEMPERATURE,
+            max_tokens=1000,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _build_translate_segment_request(self, text: str) -> dict:
+        """Build the chat completion parameters for translating one segment."""
+        return {
+            "model": settings.OPENAI_TRANSLATION_MODEL,
+            "messages": [
+                _TRANSLATE_SEGMENT_SYSTEM_MESSAGE,
+                {"role": "user", "content": TRANSLATE_SEGMENT_PROMPT.replace("{text}", text)}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 1000
+        }
+
     def translate_segment(self, text: str) -> str:
         """
         Translate a single text segment to Korean using cost-optimized model.
@@ -227,41 +470,77 @@ class OpenAIService(BaseAIService):
         Returns:
             Translated text in Korean
         """
-        if not self.is_configured:
-            return "OpenAI API 키가 설정되지 않았습니다."
+        if not self._is_configured:
+            return _API_KEY_MISSING_SHORT
 
-        prompt = f"""다음 텍스트를 한국어로 번역해주세요.
+        try:
+            # Use cost-optimized translation model (gpt-4o-mini)
+            response = self.client.chat.completions.create(**self._build_translate_segment_request(text))
+            return response.choices[0].message.content.strip()
+        except Exception:
+            logger.exception("Error in segment translation with OpenAI")
+            return TRANSLATION_ERROR_MESSAGE
+
+    def _build_translate_batch_messages(self, segments: list) -> list:
+        """Build the batch translation chat messages with numbered segments."""
+        prompt = _TRANSLATE_BATCH_PROMPT + "\n".join(f"{i}. {segment}" for i, segment in enumerate(segments))
+        return [
+            _TRANSLATE_BATCH_SYSTEM_MESSAGE,
+            {"role": "user", "content": prompt}
+        ]
+
+    def _parse_translate_batch(self, reply: str, segments: list) -> list:
+        """Map a JSON batch translation reply back onto the input segments by number."""
+        translations = [None] * len(segments)
+        try:
+            for item in json.loads(reply)["translations"]:
+                index, text = item["i"], item["t"]
+                if isinstance(index, int) and 0 <= index < len(segments) and isinstance(text, str):
+                    translations[index] = text.strip()
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Batch translation reply is not in the expected JSON format: %s", e)
+
+        missing = translations.count(None)
+        if missing:
+            logger.warning("Batch translation missing %s of %s segments", missing, len(segments))
+            # Keep the original text for segments the reply left out
+            translations = [
+                segment if translation is None else translation
+                for segment, translation in zip(segments, translations)
+            ]
+
+        return translations
 
-[번역 원칙]
-- 원문의 의미와 맥락을 정확히 전달
-- 자연스러운 한국어 표현 사용
-- 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
-- 대화체는 한국어 대화체로 자연스럽게 변환
+    def translate_batch(self, segments: list) -> list:
+        """
+        Translate multiple segments in batch using cost-optimized model.
 
-[원문]
-{text}
+        Args:
+            segments: List of text segments to translate
 
-[번역]"""
+        Returns:
+            List of translated texts in Korean
+        """
+        if not self._is_configured:
+            return [_API_KEY_MISSING_SHORT] * len(segments)
 
         try:
             # Use cost-optimized translation model (gpt-4o-mini)
             response = self.client.chat.completions.create(
                 model=settings.OPENAI_TRANSLATION_MODEL,
-                messages=[
-                    {"role": "system", "content": "당신은 전문 번역가입니다. 영어를 자연스러운 한국어로 번역해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._build_translate_batch_messages(segments),
                 temperature=0.3,
-                max_tokens=1000
+                max_tokens=8000,
+                response_format={"type": "json_object"}
             )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error in segment translation with OpenAI: {str(e)}")
-            return "번역 중 오류가 발생했습니다."
+            return self._parse_translate_batch(response.choices[0].message.content, segments)
+        except Exception:
+            logger.exception("Error in batch translation with OpenAI")
+            return [TRANSLATION_ERROR_MESSAGE] * len(segments)
 
-    def translate_batch(self, segments: list) -> list:
+    async def atranslate_batch(self, segments: list) -> list:
         """
-        Translate multiple segments in batch using cost-optimized model.
+        Async variant of translate_batch.
 
         Args:
             segments: List of text segments to translate
@@ -269,60 +548,79 @@ class OpenAIService(BaseAIService):
         Returns:
             List of translated texts in Korean
         """
-        if not self.is_configured:
-            return ["OpenAI API 키가 설정되지 않았습니다."] * len(segments)
-
-        # Join segments with separator
-        segments_text = "\n---\n".join(segments)
+        if not self._is_configured:
+            return [_API_KEY_MISSING_SHORT] * len(segments)
 
-        prompt = f"""아래 영어 텍스트 세그먼트들을 한국어로 번역해주세요.
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=settings.OPENAI_TRANSLATION_MODEL,
+                messages=self._build_translate_batch_messages(segments),
+                temperature=0.3,
+                max_tokens=8000,
+                response_format={"type": "json_object"}
+            )
+            return self._parse_translate_batch(response.choices[0].message.content, segments)
+        except Exception:
+            logger.exception("Error in batch translation with OpenAI")
+            return [TRANSLATION_ERROR_MESSAGE] * len(segments)
 
-[중요 규칙]
-1. 원문을 포함하지 말고, 번역문만 출력하세요
-2. 각 세그먼트를 순서대로 번역
-3. 번역 결과만 "---" 구분자로 분리하여 출력
-4. 원문의 의미와 맥락을 정확히 전달
-5. 자연스러운 한국어 표현 사용
-6. 전문 용어는 필요시 원어 병기 (예: "Machine Learning (기계학습)")
-7. 대화체는 한국어 대화체로 자연스럽게 변환
+    def create_translation_job(self, segments: List[str]) -> str:
+        """
+        Submit segments to the OpenAI Batch API for non-interactive translation.
 
-[출력 형식 예시]
-입력: "Hello---How are you?---Thank you"
-출력: "안녕하세요---어떻게 지내세요?---감사합니다"
+        Batch jobs cost half as much as synchronous calls and use a separate
+        rate-limit pool, but complete asynchronously (within 24 hours).
 
-[입력 텍스트]
-{segments_text}
+        Args:
+            segments: List of text segments to translate
 
-[번역 출력 (번역문만, 원문 포함하지 말 것)]"""
+        Returns:
+            Batch job ID to pass to get_translation_job
+        """
+        lines = [
+            json.dumps({
+                "custom_id": f"seg-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_translate_segment_request(segment)
+            }, ensure_ascii=False)
+            for i, segment in enumerate(segments)
+        ]
+        input_file = self.client.files.create(
+            file=("translations.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"segments": str(len(segments))}
+        )
+        logger.info("📦 Submitted OpenAI batch translation job %s (%s segments)", batch.id, len(segments))
+        return batch.id
+
+    def get_translation_job(self, job_id: str) -> Tuple[str, Optional[List[str]]]:
+        """
+        Check a batch translation job and fetch its results once completed.
 
-        try:
-            # Use cost-optimized translation model (gpt-4o-mini)
-            response = self.client.chat.completions.create(
-                model=settings.OPENAI_TRANSLATION_MODEL,
-                messages=[
-                    {"role": "system", "content": "당신은 전문 번역가입니다. 영어를 자연스러운 한국어로 번역해주세요. 원문을 포함하지 말고 번역문만 출력하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=8000
-            )
+        Args:
+            job_id: Batch job ID from create_translation_job
 
-            # Split result by separator
-            translated_text = response.choices[0].message.content.strip()
-            translations = [t.strip() for t in translated_text.split("---")]
-
-            # Validate count
-            if len(translations) != len(segments):
-                logger.warning(
-                    f"Translation count mismatch: expected {len(segments)}, got {len(translations)}"
-                )
-                # Pad with originals if too few
-                while len(translations) < len(segments):
-                    translations.append(segments[len(translations)])
-                # Truncate if too many
-                translations = translations[:len(segments)]
-
-            return translations
-        except Exception as e:
-            logger.error(f"Error in batch translation with OpenAI: {str(e)}")
-            return ["번역 중 오류가 발생했습니다."] * len(segments)
+        Returns:
+            Tuple of (job status, translations in input order or None until completed).
+            Segments the batch failed to translate get TRANSLATION_ERROR_MESSAGE.
+        """
+        batch = self.client.batches.retrieve(job_id)
+        if batch.status != "completed":
+            return batch.status, None
+
+        translations = [TRANSLATION_ERROR_MESSAGE] * int(batch.metadata["segments"])
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                result = json.loads(line)
+                response = result.get("response")
+                if response and response["status_code"] == 200:
+                    index = int(result["custom_id"].removeprefix("seg-"))
+                    translations[index] = response["body"]["choices"][0]["message"]["content"].strip()
+
+        return batch.status, translations
@@ -0,0 +1,180 @@
+"""
+Micro-batching for single-segment translation requests.
+Coalesces segments that arrive within a short window into one batch LLM call,
+and skips the call for segments whose translation is already cached.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import transcript_cache
+from app.core.config import settings
+from app.services.ai_factory import get_ai_service
+from app.services.base_ai_service import TRANSLATION_ERROR_MESSAGE, TRANSLATION_FAILED_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Translation model per provider; cached translations are keyed by it
+TRANSLATION_MODELS = {
+    "gemini": settings.GEMINI_TRANSLATION_MODEL,
+    "openai": settings.OPENAI_TRANSLATION_MODEL,
+}
+
+
+def _is_cacheable(text: str, translation: str) -> bool:
+    """Check that a translation is a real result, not an error or untranslated fallback."""
+    return (
+        translation != TRANSLATION_ERROR_MESSAGE
+        and translation != text
+        and not translation.startswith(TRANSLATION_FAILED_PREFIX)
+    )
+
+
+async def translate_with_cache(
+    provider: str, texts: List[str], translate: Callable[[List[str]], Awaitable[List[str]]]
+) -> List[str]:
+    """
+    Translate segments, sending only those without a cached translation to the LLM.
+
+    Args:
+        provider: AI provider name ('gemini' or 'openai')
+        texts: Text segments to translate
+        translate: Coroutine function translating a list of segments
+
+    Returns:
+        Translated texts in Korean, in input order
+    """
+    model = TRANSLATION_MODELS[provider]
+    translations = await run_in_threadpool(transcript_cache.get_translations, model, texts)
+
+    missing = [i for i, translation in enumerate(translations) if translation is None]
+    if not missing:
+        logger.info("💾 All %s segment(s) served from translation cache", len(texts))
+        return translations
+
+    missing_texts = [texts[i] for i in missing]
+    fresh = await translate(missing_texts)
+    for i, translation in zip(missing, fresh):
+        translations[i] = translation
+
+    cacheable = [(text, translation) for text, translation in zip(missing_texts, fresh) if _is_cacheable(text, translation)]
+    await run_in_threadpool(
+        transcript_cache.set_translations,
+        model,
+        [text for text, _ in cacheable],
+        [translation for _, translation in cacheable]
+    )
+    return translations
+
+
+class TranslationBatcher:
+    """Collects concurrent segment translations per provider and flushes them as one batch."""
+
+    def __init__(self, max_batch_size: int = 16, max_wait_ms: int = 50):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch_size: Flush as soon as this many segments are queued
+            max_wait_ms: Maximum time to wait for more segments after the first arrives
+        """
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    async def submit(self, provider: str, text: str) -> str:
+        """
+        Queue a segment for translation and wait for its result.
+
+        Args:
+            provider: AI provider name ('gemini' or 'openai')
+            text: Text segment to translate
+
+        Returns:
+            Translated text in Korean
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._get_queue(provider).put((text, future))
+        return await future
+
+    def _get_queue(self, provider: str) -> asyncio.Queue:
+        """Return the queue for a provider, starting its worker on first use."""
+        queue = self._queues.get(provider)
+        if queue is None:
+            queue = self._queues[provider] = asyncio.Queue()
+            self._workers[provider] = asyncio.create_task(self._worker(provider, queue))
+        return queue
+
+    async def _worker(self, provider: str, queue: asyncio.Queue) -> None:
+        """Drain the queue in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._max_wait
+
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(provider, batch)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+
+    async def _flush(self, provider: str, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Translate a batch with at most one LLM call and resolve each waiter."""
+        texts = [text for text, _ in batch]
+        logger.info("🌐 Flushing %s queued segment(s) for %s", len(texts), provider)
+
+        async def translate(missing: List[str]) -> List[str]:
+            ai_service = get_ai_service(provider=provider, model=None)
+            if len(missing) == 1:
+                # A lone segment keeps the single-segment prompt
+                return [await run_in_threadpool(ai_service.translate_segment, missing[0])]
+            return await ai_service.atranslate_batch(missing)
+
+        try:
+            translations = await translate_with_cache(provider, texts, translate)
+        except Exception as e:
+            logger.error("Error in batched segment translation: %s", e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), translation in zip(batch, translations):
+            if not future.done():
+                future.set_result(translation)
+
+    async def close(self) -> None:
+        """Stop all workers and fail any segments still waiting."""
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, future = queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+        self._workers.clear()
+        self._queues.clear()
+
+
+# Global batcher instance
+translation_batcher = TranslationBatcher(
+    max_batch_size=settings.TRANSLATION_BATCH_MAX_SIZE,
+    max_wait_ms=settings.TRANSLATION_BATCH_WINDOW_MS
+)
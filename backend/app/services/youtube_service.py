@@ -11,13 +11,107 @@ from youtube_transcript_api._errors import (
     AgeRestricted,
     VideoUnplayable
 )
-from urllib.parse import urlparse, parse_qs
+from cachetools import TTLCache
+from functools import lru_cache
+from operator import itemgetter
 import logging
+import random
 import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Video ID from youtu.be/ID, youtube.com/watch?...v=ID, /embed/ID, /v/ID and /shorts/ID URLs
+VIDEO_ID_PATTERN = re.compile(
+    r"(?:https?://)?"
+    r"(?:(?:www\.|m\.)?youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|v/|shorts/)|(?:www\.)?youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})",
+    re.IGNORECASE
+)
+
+# oEmbed endpoint for video title/channel (no API key needed)
+OEMBED_URL = "https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
+
+# Retries for oEmbed metadata requests: connection errors and transient
+# error statuses are retried on the pooled connection with backoff
+METADATA_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    backoff_jitter=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False
+)
+
+# Transcript listing + caption download attempts before giving up when YouTube
+# blocks the request, with a jittered exponential backoff (seconds) between attempts
+TRANSCRIPT_FETCH_ATTEMPTS = 3
+TRANSCRIPT_RETRY_BACKOFF = 0.5
+
+# Listing or caption download failures worth retrying (blocks and network
+# hiccups); anything else, e.g. TranscriptsDisabled, fails immediately
+TRANSIENT_TRANSCRIPT_ERRORS = (RequestBlocked, requests.ConnectionError, requests.Timeout)
+
+# With ScraperAPI configured, direct (unproxied) requests are skipped this long
+# after YouTube blocks one
+DIRECT_BLOCK_COOLDOWN_SECONDS = 300
+
+# Successful metadata lookups are kept this long (titles and channels rarely change)
+METADATA_TTL_SECONDS = 24 * 3600
+
+# Fetched transcripts are kept this long; entry lists are large, so keep fewer of them
+TRANSCRIPT_TTL_SECONDS = 24 * 3600
+TRANSCRIPT_CACHE_SIZE = 128
+
+# Transcript paragraphs: split once GROUP_INTERVAL seconds have passed and the
+# sentence is complete, or unconditionally after MAX_GROUP_DURATION seconds
+GROUP_INTERVAL = 30
+MAX_GROUP_DURATION = 45
+
+# Sentence-ending punctuation; all single characters, so a cue ends a sentence
+# when its last character is in the set ('...' is covered by '.')
+SENTENCE_ENDERS = frozenset('.!?。！？')
+
+# Zero-padded seconds for paragraph timestamps, indexed by second
+_SECONDS = tuple(f"{second:02d}" for second in range(60))
+
+
+class _RequestPacer:
+    """Thread-safe pacer spacing requests evenly at a maximum rate."""
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize the pacer.
+
+        Args:
+            requests_per_second: Maximum request rate; 0 or less disables pacing
+        """
+        self._interval = 1 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block the calling thread until its request slot comes up."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _format_paragraph(timestamp: float, texts: list) -> str:
+    """Format a transcript paragraph as "m:ss text1 text2 ..."."""
+    minutes, seconds = divmod(int(timestamp), 60)
+    # Texts are already stripped and non-empty; join with space to keep sentences flowing
+    return str(minutes) + ":" + _SECONDS[seconds] + " " + " ".join(texts)
+
 
 class YouTubeService:
     """Service for handling YouTube video transcript extraction."""
@@ -45,16 +139,101 @@ class YouTubeService:
             else:
                 logger.info("No YouTube cookies or ScraperAPI configured, using default settings")
 
-    def extract_video_id(self, url: str) -> str | None:
+        # Per-thread HTTP clients: requests.Session (and YouTubeTranscriptApi, which wraps one)
+        # is not thread-safe, but keeping one per threadpool worker reuses keep-alive connections
+        self._local = threading.local()
+
+        # Paces YouTube requests across all threads to stay under rate limits
+        self._pacer = _RequestPacer(settings.YOUTUBE_REQUESTS_PER_SECOND)
+
+        # Monotonic time until which direct requests are skipped in favour of ScraperAPI
+        self._direct_blocked_until = 0.0
+
+        # Video metadata by ID, shared across threads
+        self._metadata = TTLCache(maxsize=2048, ttl=METADATA_TTL_SECONDS)
+        self._metadata_lock = threading.Lock()
+
+        # Transcript entry lists by video ID, shared across threads (treat as read-only)
+        self._transcripts = TTLCache(maxsize=TRANSCRIPT_CACHE_SIZE, ttl=TRANSCRIPT_TTL_SECONDS)
+        self._transcripts_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Return this thread's HTTP session for YouTube metadata requests."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            # Retry transient failures on the pooled connection instead of failing the lookup
+            session.mount("https://", HTTPAdapter(max_retries=METADATA_RETRY))
+        return session
+
+    def _get_transcript_api(self, direct: bool = False) -> YouTubeTranscriptApi:
+        """Return this thread's transcript API client (with ScraperAPI proxy if configured, unless direct)."""
+        attr = 'direct_transcript_api' if direct else 'transcript_api'
+        api = getattr(self._local, attr, None)
+        if api is None:
+            api = YouTubeTranscriptApi(proxy_config=None if direct else self._proxy_config)
+            setattr(self._local, attr, api)
+        return api
+
+    @staticmethod
+    def _select_transcript(transcript_list):
+        """Pick Korean → English → first available transcript from a listing."""
+        try:
+            return transcript_list.find_transcript(['ko', 'en'])
+        except NoTranscriptFound:
+            # Fall back to the first available language; with none, the original error propagates
+            transcript = next(iter(transcript_list), None)
+            if transcript is None:
+                raise
+            return transcript
+
+    def _fetch_direct(self, video_id: str):
+        """
+        Try fetching a video's transcript without ScraperAPI.
+
+        Only used when ScraperAPI is configured: direct requests avoid the proxy's
+        latency and credit cost while this server's IP is not blocked. Blocks and
+        network errors on the listing or the caption download fall back to
+        ScraperAPI; after a block, direct attempts are skipped for
+        DIRECT_BLOCK_COOLDOWN_SECONDS.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Fetched transcript, or None if the caller should go through ScraperAPI
+        """
+        if self._proxy_config is None or time.monotonic() < self._direct_blocked_until:
+            return None
+        api = self._get_transcript_api(direct=True)
+        try:
+            self._pacer.wait()
+            transcript = self._select_transcript(api.list(video_id))
+            self._pacer.wait()
+            return transcript, transcript.fetch()
+        except TRANSIENT_TRANSCRIPT_ERRORS as e:
+            if isinstance(e, RequestBlocked):
+                self._direct_blocked_until = time.monotonic() + DIRECT_BLOCK_COOLDOWN_SECONDS
+                logger.warning(f"⚠️ Direct request blocked for {video_id}, using ScraperAPI for the next {DIRECT_BLOCK_COOLDOWN_SECONDS}s: {str(e)}")
+            else:
+                logger.warning(f"⚠️ Direct request failed for {video_id}, retrying through ScraperAPI: {str(e)}")
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def extract_video_id(url: str) -> str | None:
         """
         Extract video ID from various YouTube URL formats.
 
+        Results are memoized per URL, so repeat requests for the same video skip the match.
+
         Supports:
         - https://www.youtube.com/watch?v=VIDEO_ID
         - https://youtu.be/VIDEO_ID
         - https://www.youtube.com/embed/VIDEO_ID
         - https://www.youtube.com/v/VIDEO_ID
         - https://m.youtube.com/watch?v=VIDEO_ID
+        - https://www.youtube.com/shorts/VIDEO_ID
 
         Args:
             url: YouTube video URL
@@ -62,33 +241,8 @@ class YouTubeService:
         Returns:
             Video ID string or None if extraction fails
         """
-        try:
-            parsed_url = urlparse(url)
-
-            # youtu.be format
-            if parsed_url.hostname in ('youtu.be', 'www.youtu.be'):
-                return parsed_url.path[1:]
-
-            # youtube.com formats
-            if parsed_url.hostname in ('www.youtube.com', 'youtube.com', 'm.youtube.com'):
-                # /watch?v=VIDEO_ID
-                if parsed_url.path == '/watch':
-                    query_params = parse_qs(parsed_url.query)
-                    if 'v' in query_params:
-                        return query_params['v'][0]
-
-                # /embed/VIDEO_ID
-                if parsed_url.path.startswith('/embed/'):
-                    return parsed_url.path.split('/')[2]
-
-                # /v/VIDEO_ID
-                if parsed_url.path.startswith('/v/'):
-                    return parsed_url.path.split('/')[2]
-
-            return None
-        except Exception as e:
-            logger.error(f"Error extracting video ID: {str(e)}")
-            return None
+        match = VIDEO_ID_PATTERN.match(url.strip())
+        return match.group(1) if match else None
 
     def get_video_title(self, video_id: str) -> str:
         """
@@ -113,20 +267,26 @@ class YouTubeService:
         Returns:
             Dictionary with title, channel, and channel_url
         """
+        with self._metadata_lock:
+            metadata = self._metadata.get(video_id)
+        if metadata is not None:
+            return metadata
+
         try:
             # Try to fetch from oembed API (no API key needed)
-            import requests
-            response = requests.get(
-                f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json",
-                timeout=5
-            )
+            self._pacer.wait()
+            response = self._get_session().get(OEMBED_URL.format(video_id=video_id), timeout=5)
             if response.status_code == 200:
                 data = response.json()
-                return {
+                metadata = {
                     'title': data.get('title', f'YouTube Video ({video_id})'),
                     'channel': data.get('author_name', 'Unknown Channel'),
                     'channel_url': data.get('author_url', ''),
                 }
+                # Only successful lookups are cached so a failed fetch is retried next time
+                with self._metadata_lock:
+                    self._metadata[video_id] = metadata
+                return metadata
         except Exception as e:
             logger.warning(f"Failed to fetch video metadata for {video_id}: {str(e)}")
 
@@ -137,12 +297,27 @@ class YouTubeService:
             'channel_url': '',
         }
 
+    def invalidate(self, video_id: str) -> None:
+        """
+        Drop a video's cached metadata and transcript so the next request refetches them.
+
+        Args:
+            video_id: YouTube video ID
+        """
+        with self._metadata_lock:
+            self._metadata.pop(video_id, None)
+        with self._transcripts_lock:
+            self._transcripts.pop(video_id, None)
+        logger.info(f"🧹 Invalidated cached YouTube data for {video_id}")
+
     def get_transcript(self, video_id: str) -> list:
         """
         Fetch transcript for a YouTube video with enhanced anti-blocking measures.
 
-        Tries languages in this order: Korean → English → any available
-        If ScraperAPI is configured, uses it via proxy_config.
+        Tries languages in this order: Korean → English → any available, from a
+        single transcript listing. If ScraperAPI is configured, a direct fetch is tried
+        first and ScraperAPI (via proxy_config) is used when it is blocked or fails.
+        Fetched transcripts are cached per video, so repeat requests skip YouTube.
 
         Args:
             video_id: YouTube video ID
@@ -154,55 +329,46 @@ class YouTubeService:
             TranscriptsDisabled: When transcripts are disabled for the video
             NoTranscriptFound: When no transcript is available
             VideoUnavailable: When the video is not accessible
-            RequestBlocked: When YouTube blocks the request
             AgeRestricted: When video is age-restricted
             VideoUnplayable: When video cannot be played
-            Exception: For other transcript-related errors
+            RequestBlocked: When YouTube keeps blocking the request after retries
+            requests.RequestException: When the listing keeps failing on network errors
         """
-        # Create API instance with or without proxy
-        if self._proxy_config:
-            api = YouTubeTranscriptApi(http_client=None, proxy_config=self._proxy_config)
+        with self._transcripts_lock:
+            cached = self._transcripts.get(video_id)
+        if cached is not None:
+            logger.info(f"💾 Using cached transcript for {video_id}")
+            return cached
+
+        # List the video's transcripts once and pick Korean → English → any available,
+        # instead of one full listing round-trip per language attempt
+        result = self._fetch_direct(video_id)
+
+        if result is not None:
+            transcript, fetched = result
         else:
-            api = YouTubeTranscriptApi()
-        
-        try:
-            # Try Korean first
-            try:
-                fetched = api.fetch(video_id, languages=['ko'])
-                transcript = fetched.to_raw_data()
-                logger.info(f"✅ Successfully fetched Korean transcript for {video_id}")
-                return transcript
-            except (NoTranscriptFound, TranscriptsDisabled) as e:
-                logger.debug(f"Korean transcript not available: {str(e)}")
-            except RequestBlocked as e:
-                logger.warning(f"⚠️ YouTube blocked Korean request for {video_id}: {str(e)}")
-
-            # Try English
-            try:
-                fetched = api.fetch(video_id, languages=['en'])
-                transcript = fetched.to_raw_data()
-                logger.info(f"✅ Successfully fetched English transcript for {video_id}")
-                return transcript
-            except (NoTranscriptFound, TranscriptsDisabled) as e:
-                logger.debug(f"English transcript not available: {str(e)}")
-            except RequestBlocked as e:
-                logger.warning(f"⚠️ YouTube blocked English request for {video_id}: {str(e)}")
-
-            # Try any available language
-            try:
-                fetched = api.fetch(video_id)
-                transcript = fetched.to_raw_data()
-                logger.info(f"✅ Successfully fetched transcript for {video_id}")
-                return transcript
-            except RequestBlocked as e:
-                logger.error(f"❌ YouTube blocked all requests for {video_id}")
-                raise Exception("YouTube가 요청을 차단했습니다. 잠시 후 다시 시도하거나 다른 영상을 시도해주세요.")
-            except Exception as e:
-                logger.error(f"❌ Failed to fetch any transcript for {video_id}: {str(e)}")
-                raise
-        except Exception as e:
-            logger.error(f"❌ All transcript fetching methods failed for {video_id}")
-            raise
+            # Reuse this thread's API instance (proxy configured once per client)
+            api = self._get_transcript_api()
+            for attempt in range(1, TRANSCRIPT_FETCH_ATTEMPTS + 1):
+                try:
+                    self._pacer.wait()
+                    transcript = self._select_transcript(api.list(video_id))
+                    self._pacer.wait()
+                    fetched = transcript.fetch()
+                    break
+                except TRANSIENT_TRANSCRIPT_ERRORS as e:
+                    if attempt == TRANSCRIPT_FETCH_ATTEMPTS:
+                        logger.error(f"❌ All transcript fetch attempts failed for {video_id}")
+                        raise
+                    logger.warning(f"⚠️ Transcript fetch failed for {video_id} (attempt {attempt}): {str(e)}")
+                    # Back off with jitter so concurrent retries do not hit YouTube in lockstep
+                    time.sleep(TRANSCRIPT_RETRY_BACKOFF * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+
+        logger.info(f"✅ Successfully fetched {transcript.language} transcript for {video_id}")
+        entries = fetched.to_raw_data()
+        with self._transcripts_lock:
+            self._transcripts[video_id] = entries
+        return entries
 
     def format_transcript(self, transcript_list: list) -> str:
         """
@@ -222,80 +388,42 @@ class YouTubeService:
         if not transcript_list:
             return ""
 
-        grouped = []
-        current_group = {
-            'timestamp': 0,
-            'texts': []
-        }
-
-        # Group interval in seconds (30 seconds per paragraph)
-        GROUP_INTERVAL = 30
-        # Maximum group duration to prevent excessive accumulation
-        MAX_GROUP_DURATION = 45
-
-        # Sentence-ending punctuation
-        SENTENCE_ENDERS = ('.', '!', '?', '...', '。', '！', '？')
+        formatted_lines = []
+        append_line = formatted_lines.append
+        texts = []
+        group_start = 0
+        last_index = len(transcript_list) - 1
 
-        for i, entry in enumerate(transcript_list):
-            start_time = entry['start']
-            text = entry['text'].strip()
+        # Unpack the entry dicts once into parallel lists (texts stripped here)
+        starts = [entry['start'] for entry in transcript_list]
+        stripped_texts = [entry['text'].strip() for entry in transcript_list]
 
+        # Single pass: each paragraph is formatted as soon as its group closes
+        for i, (start_time, text) in enumerate(zip(starts, stripped_texts)):
             # Skip empty texts
             if not text:
                 continue
 
-            # Add text to current group
-            current_group['texts'].append(text)
+            texts.append(text)
 
-            # Check if we should start a new group
-            time_exceeded = start_time - current_group['timestamp'] >= GROUP_INTERVAL
-            max_exceeded = start_time - current_group['timestamp'] >= MAX_GROUP_DURATION
-            is_last_entry = i == len(transcript_list) - 1
+            elapsed = start_time - group_start
+            is_last_entry = i == last_index
 
-            # Check if current text ends with sentence-ending punctuation
-            ends_with_sentence = text.endswith(SENTENCE_ENDERS)
-
-            should_split = False
-
-            if max_exceeded or is_last_entry:
-                # Maximum time exceeded or last entry → force split
-                should_split = True
-            elif time_exceeded and ends_with_sentence:
-                # 30 seconds exceeded + sentence complete → split
-                should_split = True
-
-            if should_split and current_group['texts']:
-                grouped.append(current_group)
-                current_group = {
-                    'timestamp': transcript_list[i + 1]['start'] if not is_last_entry else start_time,
-                    'texts': []
-                }
-                # If not splitting, keep accumulating until we find a sentence end or timeout
+            # Force split after MAX_GROUP_DURATION or at the last entry; otherwise
+            # split once GROUP_INTERVAL has passed and the sentence is complete
+            if (
+                elapsed >= MAX_GROUP_DURATION
+                or is_last_entry
+                or (elapsed >= GROUP_INTERVAL and text[-1] in SENTENCE_ENDERS)
+            ):
+                append_line(_format_paragraph(group_start, texts))
+                texts = []
+                group_start = start_time if is_last_entry else starts[i + 1]
 
         # Add the last group
-        if current_group['texts']:
-            grouped.append(current_group)
-        
-        # Format the output
-        formatted_lines = []
-        for group in grouped:
-            # Skip groups with no text
-            if not group['texts']:
-                continue
-                
-            # Convert timestamp to mm:ss format
-            minutes = int(group['timestamp'] // 60)
-            seconds = int(group['timestamp'] % 60)
-            timestamp = f"{minutes}:{seconds:02d}"
-            
-            # Combine texts into a paragraph (filter out empty strings)
-            # Join with space to keep sentences flowing naturally
-            combined_text = " ".join([t for t in group['texts'] if t.strip()])
-
-            # Only add if there's actual content
-            if combined_text.strip():
-                formatted_lines.append(f"{timestamp} {combined_text}")
-        
+        if texts:
+            append_line(_format_paragraph(group_start, texts))
+
         return "\n\n".join(formatted_lines)
 
     def get_raw_transcript_text(self, transcript_list: list) -> str:
@@ -306,6 +434,8 @@ class YouTubeService:
             transcript_list: List of transcript entries
 
         Returns:
-            Concatenated transcript text
+            Concatenated transcript text with whitespace runs (caption line breaks,
+            tabs, repeated spaces) collapsed to single spaces
         """
-        return " ".join([entry['text'] for entry in transcript_list])
+        # str.split()/join run in C and keep the transcript limits spent on actual text
+        return " ".join(" ".join(map(itemgetter('text'), transcript_list)).split())
@@ -6,12 +6,16 @@ Extracts transcripts and generates intelligent summaries.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+import anyio.to_thread
 import uvicorn
 import logging
+import sys
 
 from app.core.config import settings
 from app.api.endpoints import router
+from app.services.translation_batcher import translation_batcher
 
 # Configure logging
 logging.basicConfig(
@@ -30,10 +34,21 @@ async def lifespan(app: FastAPI):
     logger.info(f"📍 Allowed origins: {settings.ALLOWED_ORIGINS}")
     logger.info(f"🔧 Debug mode: {settings.DEBUG}")
 
+    # run_in_threadpool shares anyio's default limiter; raise it so concurrent
+    # YouTube fetches and sync AI calls do not queue behind 40 threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    logger.info(f"🧵 Threadpool size: {settings.THREADPOOL_SIZE}")
+
     yield
 
     # Shutdown
     logger.info(f"🛑 {settings.APP_TITLE} shutting down...")
+    await translation_batcher.close()
+    # atexit only closes the sync OpenAI client; release the async pool's keep-alive
+    # sockets here. Skipped if the OpenAI service was never loaded (lazy import).
+    openai_service = sys.modules.get("app.services.openai_service")
+    if openai_service is not None:
+        await openai_service.aclose_client()
 
 
 # Create FastAPI application
@@ -53,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (full transcript + detailed summary)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(router)
 
@@ -3,10 +3,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
-from urllib.parse import urlparse, parse_qs
 import google.generativeai as genai
+import asyncio
 import os
+import re
 from dotenv import load_dotenv
+from operator import itemgetter
 import logging
 
 # Load environment variables
@@ -36,6 +38,22 @@ if not gemini_api_key or gemini_api_key == "your_gemini_api_key_here":
 else:
     genai.configure(api_key=gemini_api_key)
 
+# Shared Gemini model and generation settings (built once, reused by every request)
+GEMINI_MODEL = genai.GenerativeModel('gemini-2.0-flash-exp')
+OVERVIEW_GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "max_output_tokens": 500,
+}
+DETAIL_GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "max_output_tokens": 2000,
+}
+
+# Bounds concurrent Gemini calls across requests to respect rate limits
+GEMINI_CONCURRENCY = asyncio.Semaphore(8)
+
 # Pydantic models
 class VideoRequest(BaseModel):
     url: str
@@ -50,6 +68,15 @@ class VideoResponse(BaseModel):
 
 # --- Helper Functions ---
 
+# Video ID from youtu.be/ID, youtube.com/watch?...v=ID, /embed/ID, /v/ID and /shorts/ID URLs
+VIDEO_ID_PATTERN = re.compile(
+    r"(?:https?://)?"
+    r"(?:(?:www\.|m\.)?youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|v/|shorts/)|(?:www\.)?youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})",
+    re.IGNORECASE
+)
+
+
 def extract_video_id(url: str) -> str | None:
     """
     Extract video ID from various YouTube URL formats.
@@ -60,87 +87,45 @@ def extract_video_id(url: str) -> str | None:
     - https://www.youtube.com/embed/VIDEO_ID
     - https://www.youtube.com/v/VIDEO_ID
     - https://m.youtube.com/watch?v=VIDEO_ID
+    - https://www.youtube.com/shorts/VIDEO_ID
     """
-    try:
-        parsed_url = urlparse(url)
-
-        # youtu.be format
-        if parsed_url.hostname in ('youtu.be', 'www.youtu.be'):
-            return parsed_url.path[1:]
-
-        # youtube.com formats
-        if parsed_url.hostname in ('www.youtube.com', 'youtube.com', 'm.youtube.com'):
-            # /watch?v=VIDEO_ID
-            if parsed_url.path == '/watch':
-                query_params = parse_qs(parsed_url.query)
-                if 'v' in query_params:
-                    return query_params['v'][0]
-
-            # /embed/VIDEO_ID
-            if parsed_url.path.startswith('/embed/'):
-                return parsed_url.path.split('/')[2]
-
-            # /v/VIDEO_ID
-            if parsed_url.path.startswith('/v/'):
-                return parsed_url.path.split('/')[2]
-
-        return None
-    except Exception as e:
-        logger.error(f"Error extracting video ID: {str(e)}")
-        return None
+    match = VIDEO_ID_PATTERN.match(url.strip())
+    return match.group(1) if match else None
 
 
 def get_transcript(video_id: str) -> list:
     """
     Fetch transcript for a YouTube video.
 
-    Tries languages in this order: Korean → English → auto-generated Korean → auto-generated English
+    Lists the video's transcripts once, then tries Korean → English → any other
+    available language (manual tracks before auto-generated ones).
     """
     import xml.etree.ElementTree as ET
 
-    try:
-        # Try Korean first
-        transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko'])
-        logger.info(f"Successfully fetched Korean transcript for {video_id}")
-        return transcript
-    except ET.ParseError as e:
-        logger.error(f"XML parse error for Korean transcript: {str(e)}")
-    except Exception as e:
-        logger.debug(f"Korean transcript not available: {str(e)}")
+    transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
 
+    # Move the preferred track to the front; the rest keep their listing order
+    tracks = list(transcript_list)
     try:
-        # Try English
-        transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en'])
-        logger.info(f"Successfully fetched English transcript for {video_id}")
-        return transcript
-    except ET.ParseError as e:
-        logger.error(f"XML parse error for English transcript: {str(e)}")
-    except Exception as e:
-        logger.debug(f"English transcript not available: {str(e)}")
+        preferred = transcript_list.find_transcript(['ko', 'en'])
+        tracks.remove(preferred)
+        tracks.insert(0, preferred)
+    except NoTranscriptFound:
+        pass
 
-    try:
-        # Try any available transcript
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-
-        # Try to find Korean or English transcript
-        for transcript_info in transcript_list:
-            try:
-                transcript = transcript_info.fetch()
-                logger.info(f"Successfully fetched {transcript_info.language} transcript for {video_id}")
-                return transcript
-            except ET.ParseError as e:
-                logger.error(f"XML parse error for {transcript_info.language}: {str(e)}")
-                continue
-            except Exception as e:
-                logger.debug(f"Failed to fetch {transcript_info.language}: {str(e)}")
-                continue
-
-        # If all attempts failed
-        raise Exception("All available transcripts failed to parse")
+    for transcript_info in tracks:
+        try:
+            transcript = transcript_info.fetch()
+            logger.info(f"Successfully fetched {transcript_info.language} transcript for {video_id}")
+            return transcript
+        except ET.ParseError as e:
+            logger.error(f"XML parse error for {transcript_info.language}: {str(e)}")
+        except Exception as e:
+            logger.debug(f"Failed to fetch {transcript_info.language}: {str(e)}")
 
-    except Exception as e:
-        logger.error(f"Failed to fetch any transcript for {video_id}: {str(e)}")
-        raise
+    # If all attempts failed
+    logger.error(f"Failed to fetch any transcript for {video_id}")
+    raise Exception("All available transcripts failed to parse")
 
 
 def format_transcript(transcript_list: list) -> str:
@@ -150,15 +135,12 @@ def format_transcript(transcript_list: list) -> str:
     Format: "line_number text\n\nline_number text\n\n..."
     Example: "1 First sentence\n\n2 Second sentence"
     """
-    formatted_lines = []
-    for i, entry in enumerate(transcript_list, start=1):
-        text = entry['text'].strip()
-        formatted_lines.append(f"{i} {text}")
-
-    return "\n\n".join(formatted_lines)
+    return "\n\n".join(
+        f"{i} {entry['text'].strip()}" for i, entry in enumerate(transcript_list, start=1)
+    )
 
 
-def generate_summary_overview(transcript: str) -> str:
+async def generate_summary_overview(transcript: str) -> str:
     """
     Generate a concise 2-3 sentence summary using Gemini.
     """
@@ -178,22 +160,18 @@ def generate_summary_overview(transcript: str) -> str:
 요약:"""
 
     try:
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        response = model.generate_content(
-            prompt,
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "max_output_tokens": 500,
-            }
-        )
+        async with GEMINI_CONCURRENCY:
+            response = await GEMINI_MODEL.generate_content_async(
+                prompt,
+                generation_config=OVERVIEW_GENERATION_CONFIG
+            )
         return response.text.strip()
     except Exception as e:
         logger.error(f"Error generating overview: {str(e)}")
         return "AI 요약 생성 중 오류가 발생했습니다."
 
 
-def generate_summary_detail(transcript: str) -> str:
+async def generate_summary_detail(transcript: str) -> str:
     """
     Generate a detailed markdown summary using Gemini.
 
@@ -232,15 +210,11 @@ def generate_summary_detail(transcript: str) -> str:
 상세 요약:"""
 
     try:
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        response = model.generate_content(
-            prompt,
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "max_output_tokens": 2000,
-            }
-        )
+        async with GEMINI_CONCURRENCY:
+            response = await GEMINI_MODEL.generate_content_async(
+                prompt,
+                generation_config=DETAIL_GENERATION_CONFIG
+            )
         return response.text.strip()
     except Exception as e:
         logger.error(f"Error generating detail: {str(e)}")
@@ -292,8 +266,9 @@ async def summarize_video(request: VideoRequest):
 
     # Step 2: Fetch transcript
     try:
-        transcript_list = get_transcript(video_id)
-        full_transcript = format_transcript(transcript_list)
+        # Blocking network/CPU work runs in a worker thread so the event loop keeps serving requests
+        transcript_list = await asyncio.to_thread(get_transcript, video_id)
+        full_transcript = await asyncio.to_thread(format_transcript, transcript_list)
         logger.info(f"✅ Transcript fetched ({len(transcript_list)} entries)")
     except TranscriptsDisabled:
         logger.error(f"Transcripts disabled for video: {video_id}")
@@ -347,10 +322,13 @@ async def summarize_video(request: VideoRequest):
             logger.info("🤖 Generating AI summaries with Gemini...")
 
             # Get raw transcript text for AI processing
-            raw_text = " ".join([entry['text'] for entry in transcript_list])
+            raw_text = " ".join(map(itemgetter('text'), transcript_list))
 
-            summary_overview = generate_summary_overview(raw_text)
-            summary_detail = generate_summary_detail(raw_text)
+            # The two summaries are independent, so request them concurrently
+            summary_overview, summary_detail = await asyncio.gather(
+                generate_summary_overview(raw_text),
+                generate_summary_detail(raw_text)
+            )
 
             logger.info("✅ AI summaries generated successfully")
         except Exception as e:
@@ -359,7 +337,7 @@ async def summarize_video(request: VideoRequest):
             summary_detail = "## ⚠️ 오류\n\n요약을 생성하는 중 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
 
     # Step 4: Return response
-    response = VideoResponse(
+    response = VideoResponse.model_construct(
         video_id=video_id,
         title=f"YouTube Video ({video_id})",  # Could be enhanced with actual title fetching
         full_transcript=full_transcript,